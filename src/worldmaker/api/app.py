@@ -10,10 +10,25 @@ logger = logging.getLogger(__name__)
 try:
     from fastapi import FastAPI
     from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.responses import JSONResponse
     HAS_FASTAPI = True
 except ImportError:
     HAS_FASTAPI = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+if HAS_FASTAPI and HAS_ORJSON:
+    class _ORJSONResponse(JSONResponse):
+        """JSONResponse rendered by orjson in a single C-level pass."""
+
+        def render(self, content: Any) -> bytes:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
 
 def create_app(
     title: str = "WorldMaker API",
@@ -77,6 +92,8 @@ def create_app(
         docs_url="/api/docs",
         redoc_url="/api/redoc",
         lifespan=lifespan,
+        # orjson encodes the (often large) entity listings in one C pass
+        default_response_class=_ORJSONResponse if HAS_ORJSON else JSONResponse,
     )
 
     # CORS
@@ -13,6 +13,7 @@ try:
 
     from worldmaker.api.deps import get_memory_store
     from worldmaker.db.memory import InMemoryStore
+    from worldmaker.generators.core_attributes import index_attributes
 
     router = APIRouter()
 
@@ -66,19 +67,15 @@ try:
         the entity hasn't been assessed by the responsible core function.
         """
         # Get required attribute definitions
-        all_attrs = store.get_all("attribute_definition", limit=1000)
         required_attrs = [
-            a for a in all_attrs
+            a for a in store.iter_entities("attribute_definition")
             if a.get("required") or (tier and a.get("tier") == tier)
         ]
         if tier:
             required_attrs = [a for a in required_attrs if a.get("tier") == tier]
 
         # Build lookup: entity_type -> list of required attribute names
-        type_required: dict[str, list[dict[str, Any]]] = {}
-        for attr in required_attrs:
-            for et in attr.get("applies_to", []):
-                type_required.setdefault(et, []).append(attr)
+        type_required = index_attributes(required_attrs)["by_applies_to"]
 
         # Scan entity types
         target_types = [entity_type] if entity_type else list(type_required.keys())
@@ -90,10 +87,9 @@ try:
             if not req_attrs:
                 continue
 
-            entities = store.get_all(et, limit=10000)
-            total_entities += len(entities)
-
-            for entity in entities:
+            # Read-only scan: iterate the stored dicts instead of deep copies
+            for entity in store.iter_entities(et):
+                total_entities += 1
                 metadata = entity.get("metadata", {})
                 missing = []
 
@@ -269,8 +265,8 @@ try:
             raise HTTPException(404, f"{entity_type} {entity_id} not found")
 
         # Get definitions applicable to this entity type
-        all_attrs = store.get_all("attribute_definition", limit=1000)
-        applicable = [a for a in all_attrs if entity_type in a.get("applies_to", [])]
+        applicable = [a for a in store.iter_entities("attribute_definition")
+                      if entity_type in a.get("applies_to", [])]
 
         metadata = entity.get("metadata", {})
         attributes: list[dict[str, Any]] = []
@@ -1,6 +1,5 @@
 """WorldMaker CLI — command-line interface for ecosystem management."""
 from __future__ import annotations
-import json
 import sys
 import logging
 
@@ -42,7 +41,7 @@ if HAS_CLICK:
     def generate(seed: int, size: str, output: str | None, fmt: str) -> None:
         """Generate a synthetic enterprise ecosystem."""
         try:
-            from ..generators.ecosystem import generate_ecosystem
+            from ..generators.ecosystem import ecosystem_to_json, generate_ecosystem
         except ImportError:
             click.echo("Error: ecosystem generator not available")
             sys.exit(1)
@@ -58,7 +57,7 @@ if HAS_CLICK:
             total = sum(summary.values()) if summary else 0
             click.echo(f"\n  Total entities: {total}")
         else:
-            result = json.dumps(ecosystem, indent=2, default=str)
+            result = ecosystem_to_json(ecosystem)
             if output:
                 with open(output, "w") as f:
                     f.write(result)
@@ -6,8 +6,8 @@ stored on the local filesystem.
 from __future__ import annotations
 
 import logging
-import os
 import shutil
+from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
 
@@ -22,20 +22,147 @@ from .templates import (
 logger = logging.getLogger(__name__)
 
 
+class FilesystemBackend(ABC):
+    """Storage for scaffolded repo files, keyed by repo name and file name."""
+
+    @abstractmethod
+    def write(self, repo: str, filename: str, content: str) -> str:
+        """Write a file and return its path."""
+        ...
+
+    @abstractmethod
+    def list_files(self, repo: str) -> list[dict[str, Any]] | None:
+        """List a repo's files as name/size/path dicts, or None if absent."""
+        ...
+
+    @abstractmethod
+    def read(self, repo: str, filename: str) -> str | None:
+        """Read a file, or None if it does not exist."""
+        ...
+
+    @abstractmethod
+    def list_repos(self) -> list[str]:
+        """Sorted names of all repos."""
+        ...
+
+    @abstractmethod
+    def delete_repo(self, repo: str, ignore_errors: bool = False) -> bool:
+        """Remove a repo and its files.  Returns False if it did not exist."""
+        ...
+
+
+class DiskBackend(FilesystemBackend):
+    """Repo files stored as directories under a root path."""
+
+    def __init__(self, root: Path):
+        self._root = root
+        self._root.mkdir(parents=True, exist_ok=True)
+
+    def write(self, repo: str, filename: str, content: str) -> str:
+        repo_dir = self._root / repo
+        repo_dir.mkdir(parents=True, exist_ok=True)
+        path = repo_dir / filename
+        path.write_text(content, encoding="utf-8")
+        return str(path)
+
+    def list_files(self, repo: str) -> list[dict[str, Any]] | None:
+        repo_dir = self._root / repo
+        if not repo_dir.is_dir():
+            return None
+        return [
+            {"name": f.name, "size": f.stat().st_size, "path": str(f)}
+            for f in sorted(repo_dir.iterdir())
+            if f.is_file()
+        ]
+
+    def read(self, repo: str, filename: str) -> str | None:
+        file_path = self._root / repo / filename
+        if not file_path.is_file():
+            return None
+        # Prevent path traversal
+        if not file_path.resolve().is_relative_to(self._root):
+            return None
+        return file_path.read_text(encoding="utf-8")
+
+    def list_repos(self) -> list[str]:
+        if not self._root.is_dir():
+            return []
+        return sorted(d.name for d in self._root.iterdir() if d.is_dir())
+
+    def delete_repo(self, repo: str, ignore_errors: bool = False) -> bool:
+        repo_dir = self._root / repo
+        if not repo_dir.is_dir():
+            return False
+        shutil.rmtree(repo_dir, ignore_errors=ignore_errors)
+        return True
+
+
+class MemoryBackend(FilesystemBackend):
+    """Repo files held in a dict — for tests and throwaway runs."""
+
+    def __init__(self, root: Path):
+        self._root = root
+        self._repos: dict[str, dict[str, str]] = {}
+
+    def write(self, repo: str, filename: str, content: str) -> str:
+        self._repos.setdefault(repo, {})[filename] = content
+        return str(self._root / repo / filename)
+
+    def list_files(self, repo: str) -> list[dict[str, Any]] | None:
+        files = self._repos.get(repo)
+        if files is None:
+            return None
+        return [
+            {
+                "name": name,
+                "size": len(files[name].encode("utf-8")),
+                "path": str(self._root / repo / name),
+            }
+            for name in sorted(files)
+        ]
+
+    def read(self, repo: str, filename: str) -> str | None:
+        return self._repos.get(repo, {}).get(filename)
+
+    def list_repos(self) -> list[str]:
+        return sorted(self._repos)
+
+    def delete_repo(self, repo: str, ignore_errors: bool = False) -> bool:
+        return self._repos.pop(repo, None) is not None
+
+
 class CodeRepoManager:
-    """Manages microservice code repositories on disk.
+    """Manages microservice code repositories on disk or in memory.
 
     Parameters
     ----------
     base_path : str
         Root directory for all microservice repos.  Can be relative
         (resolved from cwd) or absolute.
+    backend : str or FilesystemBackend
+        ``"disk"`` (default) writes real files under ``base_path``;
+        ``"memory"`` keeps them in a dict and never touches the filesystem.
+        A ``FilesystemBackend`` instance is used as given.
+
+    Raises
+    ------
+    ValueError
+        If ``backend`` is an unknown name.
     """
 
-    def __init__(self, base_path: str = "repos"):
+    def __init__(self, base_path: str = "repos",
+                 backend: str | FilesystemBackend = "disk"):
         self._base = Path(base_path).resolve()
-        self._base.mkdir(parents=True, exist_ok=True)
-        logger.debug("CodeRepoManager base path: %s", self._base)
+        self._backend: FilesystemBackend
+        if isinstance(backend, FilesystemBackend):
+            self._backend = backend
+        elif backend == "memory":
+            self._backend = MemoryBackend(self._base)
+        elif backend == "disk":
+            self._backend = DiskBackend(self._base)
+        else:
+            raise ValueError(f"Unknown code repo backend {backend!r}; expected 'disk' or 'memory'")
+        logger.debug("CodeRepoManager base path: %s (%s)", self._base, backend)
 
     @property
     def base_path(self) -> Path:
@@ -52,50 +179,19 @@ class CodeRepoManager:
         lang = microservice.get("language", "python")
         tmpl = LANGUAGE_TEMPLATES.get(lang, LANGUAGE_TEMPLATES["python"])
 
-        repo_dir = self._base / name
-        repo_dir.mkdir(parents=True, exist_ok=True)
-
         files_written: list[dict[str, Any]] = []
-
-        # Handler
-        handler_content = generate_handler(microservice)
-        handler_path = repo_dir / tmpl["handler_file"]
-        handler_path.write_text(handler_content, encoding="utf-8")
-        files_written.append({
-            "name": tmpl["handler_file"],
-            "size": len(handler_content),
-            "path": str(handler_path),
-        })
-
-        # Dependency file
-        deps_content = generate_deps(microservice)
-        dep_path = repo_dir / tmpl["dep_file"]
-        dep_path.write_text(deps_content, encoding="utf-8")
-        files_written.append({
-            "name": tmpl["dep_file"],
-            "size": len(deps_content),
-            "path": str(dep_path),
-        })
-
-        # Dockerfile
-        dockerfile_content = generate_dockerfile(microservice)
-        dockerfile_path = repo_dir / "Dockerfile"
-        dockerfile_path.write_text(dockerfile_content, encoding="utf-8")
-        files_written.append({
-            "name": "Dockerfile",
-            "size": len(dockerfile_content),
-            "path": str(dockerfile_path),
-        })
-
-        # README
-        readme_content = generate_readme(microservice)
-        readme_path = repo_dir / "README.md"
-        readme_path.write_text(readme_content, encoding="utf-8")
-        files_written.append({
-            "name": "README.md",
-            "size": len(readme_content),
-            "path": str(readme_path),
-        })
+        for filename, content in (
+            (tmpl["handler_file"], generate_handler(microservice)),
+            (tmpl["dep_file"], generate_deps(microservice)),
+            ("Dockerfile", generate_dockerfile(microservice)),
+            ("README.md", generate_readme(microservice)),
+        ):
+            path = self._backend.write(name, filename, content)
+            files_written.append({
+                "name": filename,
+                "size": len(content),
+                "path": path,
+            })
 
         manifest = {
             "microservice_id": microservice.get("id", ""),
@@ -103,7 +199,7 @@ class CodeRepoManager:
             "language": lang,
             "framework": microservice.get("framework", ""),
             "files": files_written,
-            "repo_path": str(repo_dir),
+            "repo_path": str(self._base / name),
         }
 
         logger.debug("Scaffolded %s (%s/%s): %d files",
@@ -139,49 +235,30 @@ class CodeRepoManager:
 
     def get_manifest(self, ms_name: str) -> dict[str, Any] | None:
         """Get file manifest for a microservice repo."""
-        repo_dir = self._base / ms_name
-        if not repo_dir.is_dir():
+        files = self._backend.list_files(ms_name)
+        if files is None:
             return None
 
-        files = []
-        for f in sorted(repo_dir.iterdir()):
-            if f.is_file():
-                files.append({
-                    "name": f.name,
-                    "size": f.stat().st_size,
-                    "path": str(f),
-                })
-
         return {
             "microservice_name": ms_name,
             "files": files,
-            "repo_path": str(repo_dir),
+            "repo_path": str(self._base / ms_name),
         }
 
     def get_file_content(self, ms_name: str, filename: str) -> str | None:
         """Read a specific file from a microservice repo."""
-        file_path = self._base / ms_name / filename
-        if not file_path.is_file():
-            return None
-        # Prevent path traversal
-        if not file_path.resolve().is_relative_to(self._base):
-            return None
-        return file_path.read_text(encoding="utf-8")
+        return self._backend.read(ms_name, filename)
 
     def list_repos(self) -> list[str]:
         """List all microservice repo names."""
-        if not self._base.is_dir():
-            return []
-        return sorted(d.name for d in self._base.iterdir() if d.is_dir())
+        return self._backend.list_repos()
 
     # ── Cleanup ──────────────────────────────────────────────────────────
 
     def delete_repo(self, ms_name: str) -> bool:
         """Remove a microservice's code directory."""
-        repo_dir = self._base / ms_name
-        if not repo_dir.is_dir():
+        if not self._backend.delete_repo(ms_name):
             return False
-        shutil.rmtree(repo_dir)
         logger.info("Deleted code repo: %s", ms_name)
         return True
 
@@ -189,6 +266,6 @@ class CodeRepoManager:
         """Remove all microservice repos.  Returns count deleted."""
         repos = self.list_repos()
         for name in repos:
-            shutil.rmtree(self._base / name, ignore_errors=True)
+            self._backend.delete_repo(name, ignore_errors=True)
         logger.info("Cleared %d code repos", len(repos))
         return len(repos)
@@ -9,8 +9,12 @@ This is the default store used when no database connections are configured.
 from __future__ import annotations
 import copy
 import logging
-from collections import defaultdict
+import pickle
+from collections import defaultdict, deque
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any, Optional
 from uuid import UUID, uuid4
 
@@ -28,9 +32,17 @@ class InMemoryStore:
     - Full-text-ish search on name fields
     """
 
-    def __init__(self):
+    def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        """Set every container to its empty state; shared by __init__ and __setstate__."""
         # Entity storage: {entity_type: {id_str: entity_dict}}
         self._entities: dict[str, dict[str, dict[str, Any]]] = defaultdict(dict)
+        # Insertion sequence per entity, so index lookups can be put back
+        # into insertion order without scanning the type bucket
+        self._entity_seq: dict[str, dict[str, int]] = defaultdict(dict)
+        self._next_seq = 0
 
         # Dependency graph: adjacency lists
         self._dependencies: list[dict[str, Any]] = []
@@ -39,6 +51,10 @@ class InMemoryStore:
 
         # Audit log
         self._audit_log: list[dict[str, Any]] = []
+        self._audit_enabled = True
+        # entity_id -> audit log positions, caught up lazily by get_audit_log()
+        self._audit_by_entity: dict[str, list[int]] = defaultdict(list)
+        self._audit_indexed = 0
 
         # Flow traces
         self._traces: list[dict[str, Any]] = []
@@ -49,23 +65,76 @@ class InMemoryStore:
         # Counters
         self._stats: dict[str, int] = defaultdict(int)
 
+        # Secondary indexes, built lazily by get_by_attr():
+        # {(entity_type, attr): {value: {id_str: None}}} — dicts keep order
+        self._attr_index: dict[tuple[str, str], dict[Any, dict[str, None]]] = {}
+
     # ---- Generic CRUD ----
 
     def create(self, entity_type: str, data: dict[str, Any]) -> dict[str, Any]:
-        """Create an entity. Auto-generates id and timestamps if missing."""
+        """Create an entity. Auto-generates id and timestamps if missing.
+
+        The stored (and returned) id is always a string. An existing entity
+        with the same id is replaced. Returns a copy of the stored entity.
+        """
         entity = dict(data)
         if "id" not in entity:
             entity["id"] = str(uuid4())
-        entity_id = str(entity["id"])
+        entity_id = entity["id"] = str(entity["id"])
         entity.setdefault("created_at", datetime.utcnow().isoformat())
         entity.setdefault("updated_at", entity["created_at"])
         entity.setdefault("metadata", {})
 
-        self._entities[entity_type][entity_id] = entity
+        self._put(entity_type, entity_id, entity)
         self._stats[f"{entity_type}_created"] += 1
 
         self._audit(entity_id, entity_type, "created", new_state=entity)
-        return entity
+        return copy.deepcopy(entity)
+
+    def create_many(self, entity_type: str,
+                    items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create several entities of one type in a single pass.
+
+        Same result as calling create() per item, each with its own audit
+        entry, but the timestamp and lookups are taken once for the batch.
+        """
+        return [copy.deepcopy(e) for e in self._insert_many(entity_type, items)]
+
+    def _insert_many(self, entity_type: str,
+                     items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        # create_many() without copying the results, for bulk loads
+        now = datetime.utcnow().isoformat()
+        bucket = self._entities[entity_type]
+        created: list[dict[str, Any]] = []
+        for data in items:
+            entity = dict(data)
+            if "id" not in entity:
+                entity["id"] = str(uuid4())
+            entity_id = entity["id"] = str(entity["id"])
+            entity.setdefault("created_at", now)
+            entity.setdefault("updated_at", entity["created_at"])
+            entity.setdefault("metadata", {})
+
+            self._put(entity_type, entity_id, entity, bucket)
+            self._audit(entity_id, entity_type, "created", new_state=entity, timestamp=now)
+            created.append(entity)
+
+        self._stats[f"{entity_type}_created"] += len(created)
+        return created
+
+    def _put(self, entity_type: str, entity_id: str, entity: dict[str, Any],
+             bucket: dict[str, dict[str, Any]] | None = None) -> None:
+        # Store an entity, dropping a replaced record's index entries first
+        if bucket is None:
+            bucket = self._entities[entity_type]
+        old = bucket.get(entity_id)
+        if old is not None:
+            self._index_discard(entity_type, entity_id, old)
+        else:
+            self._entity_seq[entity_type][entity_id] = self._next_seq
+            self._next_seq += 1
+        bucket[entity_id] = entity
+        self._index_add(entity_type, entity_id, entity)
 
     def get(self, entity_type: str, entity_id: str) -> dict[str, Any] | None:
         """Get entity by type and ID."""
@@ -73,14 +142,32 @@ class InMemoryStore:
 
     def get_all(self, entity_type: str, limit: int = 100, offset: int = 0,
                 filters: dict[str, Any] | None = None) -> list[dict[str, Any]]:
-        """Get all entities of a type with optional filtering."""
-        entities = list(self._entities.get(entity_type, {}).values())
+        """Get all entities of a type with optional filtering.
 
-        if filters:
-            for key, value in filters.items():
-                entities = [e for e in entities if e.get(key) == value]
+        The first filter is answered from the attribute index and the matches
+        are sorted by insertion sequence, so filtered results keep insertion
+        order (and limit/offset paging is consistent) without a full scan.
+        """
+        bucket = self._entities.get(entity_type, {})
+        if not filters:
+            entities = list(bucket.values())
+            return [copy.deepcopy(e) for e in entities[offset:offset + limit]]
 
-        return [copy.deepcopy(e) for e in entities[offset:offset + limit]]
+        (key, value), *rest = filters.items()
+        ids = self._ids_by_attr(entity_type, key, value)
+        if rest:
+            ids = [eid for eid in ids if all(bucket[eid].get(k) == v for k, v in rest)]
+        ids.sort(key=self._entity_seq[entity_type].__getitem__)
+        return [copy.deepcopy(bucket[eid]) for eid in ids[offset:offset + limit]]
+
+    def iter_entities(self, entity_type: str) -> Iterator[Mapping[str, Any]]:
+        """Iterate the stored entities of a type without copying them.
+
+        For read-only scans: each entity is yielded as a read-only view, so
+        writes must go through update() to keep the indexes current.
+        """
+        for entity in self._entities.get(entity_type, {}).values():
+            yield MappingProxyType(entity)
 
     def update(self, entity_type: str, entity_id: str,
                updates: dict[str, Any]) -> dict[str, Any] | None:
@@ -90,9 +177,14 @@ class InMemoryStore:
         if not entity:
             return None
 
-        previous = copy.deepcopy(entity)
+        previous = copy.deepcopy(entity) if self._audit_enabled else None
+        # Only re-index changed values, so unchanged entities keep their slot
+        changed = [k for k, v in updates.items() if k not in entity or entity[k] != v]
+        changed.append("updated_at")
+        self._index_discard(entity_type, entity_id, entity, changed)
         entity.update(updates)
         entity["updated_at"] = datetime.utcnow().isoformat()
+        self._index_add(entity_type, entity_id, entity, changed)
 
         self._audit(entity_id, entity_type, "modified",
                     previous_state=previous, new_state=entity)
@@ -103,6 +195,8 @@ class InMemoryStore:
         entity_id = str(entity_id)
         if entity_id in self._entities.get(entity_type, {}):
             entity = self._entities[entity_type].pop(entity_id)
+            del self._entity_seq[entity_type][entity_id]
+            self._index_discard(entity_type, entity_id, entity)
             self._audit(entity_id, entity_type, "deleted", previous_state=entity)
             return True
         return False
@@ -111,6 +205,9 @@ class InMemoryStore:
         """Count entities of a type."""
         if not filters:
             return len(self._entities.get(entity_type, {}))
+        if len(filters) == 1:
+            (attr, value), = filters.items()
+            return len(self._ids_by_attr(entity_type, attr, value))
         return len(self.get_all(entity_type, limit=999999, filters=filters))
 
     def search(self, entity_type: str, query: str, fields: list[str] | None = None) -> list[dict[str, Any]]:
@@ -126,6 +223,63 @@ class InMemoryStore:
                     break
         return results
 
+    def get_by_attr(self, entity_type: str, attr: str, value: Any) -> list[dict[str, Any]]:
+        """Get all entities of a type whose ``attr`` equals ``value`` exactly.
+
+        Backed by a hash index on (entity_type, attr) that is built on first
+        use and kept current by create/update/delete.
+        """
+        entities = self._entities.get(entity_type, {})
+        return [copy.deepcopy(entities[eid])
+                for eid in self._ids_by_attr(entity_type, attr, value)]
+
+    # ---- Secondary Indexes ----
+
+    def _ids_by_attr(self, entity_type: str, attr: str, value: Any) -> list[str]:
+        try:
+            hash(value)
+        except TypeError:
+            # Unhashable values (lists, dicts) are never indexed
+            return [eid for eid, e in self._entities.get(entity_type, {}).items()
+                    if e.get(attr) == value]
+        index = self._attr_index.get((entity_type, attr))
+        if index is None:
+            index = self._attr_index[(entity_type, attr)] = {}
+            for eid, entity in self._entities.get(entity_type, {}).items():
+                self._index_put(index, attr, eid, entity)
+        return list(index.get(value, ()))
+
+    @staticmethod
+    def _index_put(index: dict[Any, dict[str, None]], attr: str, entity_id: str,
+                   entity: dict[str, Any]) -> None:
+        value = entity.get(attr)
+        try:
+            index.setdefault(value, {})[entity_id] = None
+        except TypeError:
+            pass
+
+    def _index_add(self, entity_type: str, entity_id: str, entity: dict[str, Any],
+                   attrs: list[str] | None = None) -> None:
+        if not self._attr_index:
+            return
+        for (et, attr), index in self._attr_index.items():
+            if et == entity_type and (attrs is None or attr in attrs):
+                self._index_put(index, attr, entity_id, entity)
+
+    def _index_discard(self, entity_type: str, entity_id: str, entity: dict[str, Any],
+                       attrs: list[str] | None = None) -> None:
+        if not self._attr_index:
+            return
+        for (et, attr), index in self._attr_index.items():
+            if et != entity_type or (attrs is not None and attr not in attrs):
+                continue
+            try:
+                ids = index.get(entity.get(attr))
+            except TypeError:
+                continue
+            if ids is not None:
+                ids.pop(entity_id, None)
+
     # ---- Dependency Graph ----
 
     def add_dependency(self, source_id: str, target_id: str,
@@ -234,46 +388,73 @@ class InMemoryStore:
 
     def _has_path(self, from_id: str, to_id: str, max_depth: int = 20) -> bool:
         """Check if there's a path from from_id to to_id in the dependency graph."""
+        # Walks the source index directly: get_dependencies_of() would
+        # deep-copy every edge, and this runs once per add_dependency()
+        deps = self._dependencies
         visited: set[str] = set()
-        queue: list[tuple[str, int]] = [(from_id, 0)]
+        queue: deque[tuple[str, int]] = deque([(from_id, 0)])
         while queue:
-            current, depth = queue.pop(0)
+            current, depth = queue.popleft()
             if current == to_id:
                 return True
             if current in visited or depth > max_depth:
                 continue
             visited.add(current)
-            for dep in self.get_dependencies_of(current):
-                queue.append((dep["target_id"], depth + 1))
+            for i in self._dep_index_source.get(current, ()):
+                queue.append((deps[i]["target_id"], depth + 1))
         return False
 
     # ---- Audit Log ----
 
     def _audit(self, entity_id: str, entity_type: str, action: str,
                actor: str = "system", previous_state: dict | None = None,
-               new_state: dict | None = None) -> None:
+               new_state: dict | None = None, timestamp: str | None = None) -> None:
+        if not self._audit_enabled:
+            return
         self._audit_log.append({
             "id": str(uuid4()),
             "entity_id": entity_id,
             "entity_type": entity_type,
             "action": action,
             "actor": actor,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp or datetime.utcnow().isoformat(),
             "previous_state": previous_state,
             "new_state": new_state,
         })
 
+    @contextmanager
+    def audit_disabled(self) -> Iterator[None]:
+        """Suspend audit logging for bulk writes whose history is not needed."""
+        previous, self._audit_enabled = self._audit_enabled, False
+        try:
+            yield
+        finally:
+            self._audit_enabled = previous
+
     def get_audit_log(self, entity_id: str | None = None,
                       entity_type: str | None = None,
                       limit: int = 100) -> list[dict[str, Any]]:
         """Get audit log entries, optionally filtered."""
         entries = self._audit_log
         if entity_id:
-            entries = [e for e in entries if e["entity_id"] == str(entity_id)]
+            entries = [entries[i] for i in self._audit_positions(str(entity_id))]
         if entity_type:
             entries = [e for e in entries if e["entity_type"] == entity_type]
         return entries[-limit:]
 
+    def _audit_positions(self, entity_id: str) -> list[int]:
+        # The log is append-only between resets, so only index the new tail
+        log = self._audit_log
+        by_entity = self._audit_by_entity
+        for i in range(self._audit_indexed, len(log)):
+            by_entity[log[i]["entity_id"]].append(i)
+        self._audit_indexed = len(log)
+        return by_entity.get(entity_id, [])
+
+    def _reset_audit_index(self) -> None:
+        self._audit_by_entity.clear()
+        self._audit_indexed = 0
+
     # ---- Trace Storage ----
 
     def store_trace(self, trace: dict[str, Any]) -> None:
@@ -328,8 +509,7 @@ class InMemoryStore:
 
         for plural_key, entity_type in entity_types:
             items = ecosystem.get(plural_key, [])
-            for item in items:
-                self.create(entity_type, item)
+            self._insert_many(entity_type, items)
             loaded[entity_type] = len(items)
 
         # Load dependencies into the graph
@@ -364,6 +544,7 @@ class InMemoryStore:
             counts[entity_type] = len(to_delete)
             for eid in to_delete:
                 del self._entities[entity_type][eid]
+                del self._entity_seq[entity_type][eid]
 
         # Filter dependencies — remove edges where source OR target was deleted
         surviving_ids: set[str] = set()
@@ -378,6 +559,7 @@ class InMemoryStore:
         counts["dependencies"] = original_dep_count - len(self._dependencies)
 
         self._rebuild_dep_indexes()
+        self._attr_index.clear()
 
         # Clear traces, spans, audit log (execution artifacts)
         counts["traces"] = len(self._traces)
@@ -385,6 +567,7 @@ class InMemoryStore:
         self._traces.clear()
         self._spans.clear()
         self._audit_log.clear()
+        self._reset_audit_index()
 
         return counts
 
@@ -396,6 +579,33 @@ class InMemoryStore:
             self._dep_index_source[dep["source_id"]].append(idx)
             self._dep_index_target[dep["target_id"]].append(idx)
 
+    # ---- Snapshots ----
+
+    _STATE_ATTRS = (
+        "_entities", "_entity_seq", "_next_seq", "_dependencies", "_dep_index_source", "_dep_index_target",
+        "_audit_log", "_traces", "_spans", "_stats",
+    )
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The attribute index is derived data; it is rebuilt lazily on demand
+        return {name: getattr(self, name) for name in self._STATE_ATTRS}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._reset()
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def snapshot(self) -> bytes:
+        """Serialize the full store state to bytes for a later restore()."""
+        return pickle.dumps(self.__getstate__(), protocol=pickle.HIGHEST_PROTOCOL)
+
+    def restore(self, blob: bytes) -> None:
+        """Replace the store state with a fresh copy of a snapshot()."""
+        for name, value in pickle.loads(blob).items():
+            setattr(self, name, value)
+        self._attr_index.clear()
+        self._reset_audit_index()
+
     # ---- Stats ----
 
     def get_overview(self) -> dict[str, Any]:
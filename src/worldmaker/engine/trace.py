@@ -35,7 +35,7 @@ def _generate_span_id() -> str:
     return uuid4().hex[:16]
 
 
-@dataclass
+@dataclass(slots=True)
 class SpanEvent:
     """An event (log line) within a span."""
     name: str
@@ -50,7 +50,7 @@ class SpanEvent:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SpanLink:
     """A link to another span (for async/batch relationships)."""
     trace_id: str
@@ -65,7 +65,7 @@ class SpanLink:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Span:
     """OpenTelemetry-compatible span."""
     trace_id: str
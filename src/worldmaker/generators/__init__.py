@@ -2,8 +2,8 @@
 from .base import BaseGenerator, GeneratorConfig
 from .names import NameGenerator
 from .ecosystem import EcosystemGenerator, generate_ecosystem
-from .core_platforms import bootstrap_core, CORE_PLATFORMS
-from .core_attributes import bootstrap_core_attributes, ALL_ATTRIBUTES
+from .core_platforms import bootstrap_core, CORE_PLATFORMS, CORE_PLATFORM_NAMES, CORE_CAPABILITY_COUNT
+from .core_attributes import bootstrap_core_attributes, index_attributes, ALL_ATTRIBUTES
 
 __all__ = [
     "BaseGenerator",
@@ -13,6 +13,9 @@ __all__ = [
     "generate_ecosystem",
     "bootstrap_core",
     "CORE_PLATFORMS",
+    "CORE_PLATFORM_NAMES",
+    "CORE_CAPABILITY_COUNT",
     "bootstrap_core_attributes",
+    "index_attributes",
     "ALL_ATTRIBUTES",
 ]
@@ -3,9 +3,9 @@ from __future__ import annotations
 import random
 import string
 from datetime import datetime, timedelta
+from collections.abc import Sequence
 from enum import Enum
 from typing import Any, TypeVar
-from uuid import UUID, uuid4
 
 T = TypeVar("T")
 
@@ -89,16 +89,18 @@ class BaseGenerator:
     def _uuid(self) -> str:
         """Generate a deterministic UUID-like string."""
         self._id_counter += 1
-        # Use rng to create reproducible UUIDs
-        return str(UUID(int=self._rng.getrandbits(128)))
+        # Format the rng bits directly — same string as str(UUID(int=...))
+        # without constructing and validating a UUID object per entity
+        h = f"{self._rng.getrandbits(128):032x}"
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
     
-    def _choice(self, items: list[T]) -> T:
+    def _choice(self, items: Sequence[T]) -> T:
         return self._rng.choice(items)
     
-    def _choices(self, items: list[T], k: int) -> list[T]:
+    def _choices(self, items: Sequence[T], k: int) -> list[T]:
         return self._rng.choices(items, k=k)
     
-    def _sample(self, items: list[T], k: int) -> list[T]:
+    def _sample(self, items: Sequence[T], k: int) -> list[T]:
         k = min(k, len(items))
         return self._rng.sample(items, k)
     
@@ -113,12 +115,23 @@ class BaseGenerator:
         lo, hi = self._config.range(key)
         return self._randint(lo, hi)
     
+    def _random_ranges(self, key: str, k: int) -> list[int]:
+        """Draw k values within a config range in a single RNG call."""
+        lo, hi = self._config.range(key)
+        return self._rng.choices(range(lo, hi + 1), k=k)
+    
     def _random_datetime(self, days_back: int = 365) -> str:
         """Generate a random datetime within the past N days."""
         delta = timedelta(days=self._rng.randint(0, days_back))
         dt = datetime.utcnow() - delta
         return dt.isoformat()
     
+    def _random_datetimes(self, days_back: int, k: int) -> list[str]:
+        """Generate k random datetimes within the past N days in one draw."""
+        now = datetime.utcnow()
+        return [(now - timedelta(days=d)).isoformat()
+                for d in self._rng.choices(range(days_back + 1), k=k)]
+    
     def _probability(self, p: float) -> bool:
         """Return True with probability p."""
         return self._rng.random() < p
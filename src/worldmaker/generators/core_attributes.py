@@ -243,6 +243,35 @@ FUNCTION_ATTRIBUTES: list[dict[str, Any]] = [
 ALL_ATTRIBUTES = CORE_ATTRIBUTES + LIFECYCLE_ATTRIBUTES + FUNCTION_ATTRIBUTES
 
 
+# ── Indexing ─────────────────────────────────────────────────────────────
+
+def index_attributes(attrs: Any) -> dict[str, dict[str, list[dict[str, Any]]]]:
+    """Group attribute definitions for lookup in a single pass.
+
+    Returns
+    -------
+    dict
+        ``by_tier`` (tier -> definitions), ``by_applies_to`` (entity type ->
+        definitions) and ``required_by_entity`` (entity type -> required
+        definitions). Lists preserve the input order.
+    """
+    by_tier: dict[str, list[dict[str, Any]]] = {}
+    by_applies_to: dict[str, list[dict[str, Any]]] = {}
+    required_by_entity: dict[str, list[dict[str, Any]]] = {}
+    for attr in attrs:
+        by_tier.setdefault(attr.get("tier", "unknown"), []).append(attr)
+        required = attr.get("required")
+        for et in attr.get("applies_to", []):
+            by_applies_to.setdefault(et, []).append(attr)
+            if required:
+                required_by_entity.setdefault(et, []).append(attr)
+    return {
+        "by_tier": by_tier,
+        "by_applies_to": by_applies_to,
+        "required_by_entity": required_by_entity,
+    }
+
+
 # ── Bootstrap Function ───────────────────────────────────────────────────
 
 def bootstrap_core_attributes(store: Any) -> dict[str, Any]:
@@ -261,9 +290,8 @@ def bootstrap_core_attributes(store: Any) -> dict[str, Any]:
     dict
         Counts by tier, or ``{"skipped": True}``.
     """
-    # Idempotency check
-    existing = store.get_all("attribute_definition", limit=1, filters={"layer": "core"})
-    if existing:
+    # Idempotency check: any core-layer definition means we already ran
+    if store.count("attribute_definition", {"layer": "core"}):
         logger.debug("Core attributes already bootstrapped — skipping")
         return {"skipped": True}
 
@@ -141,6 +141,10 @@ CORE_PLATFORMS: list[dict[str, Any]] = [
     },
 ]
 
+# Fixed by the definitions above; precomputed so callers needn't re-walk them
+CORE_PLATFORM_NAMES: frozenset[str] = frozenset(p["name"] for p in CORE_PLATFORMS)
+CORE_CAPABILITY_COUNT: int = sum(len(p["capabilities"]) for p in CORE_PLATFORMS)
+
 
 def _slug(name: str) -> str:
     """Convert a human name to a service-style slug (e.g. 'Product Onboarding' -> 'ProductOnboardingService')."""
@@ -166,8 +170,7 @@ def bootstrap_core(store: Any) -> dict[str, Any]:
         bootstrapped.
     """
     # Idempotency check: look for any platform with layer="core"
-    existing = store.get_all("platform", limit=1, filters={"layer": "core"})
-    if existing:
+    if store.count("platform", {"layer": "core"}):
         logger.debug("Core platforms already bootstrapped — skipping")
         return {"skipped": True}
 
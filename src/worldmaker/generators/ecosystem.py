@@ -4,19 +4,90 @@ Generates a complete enterprise digital ecosystem top-down:
 Products → Platforms → Capabilities → Services → Microservices → Flows → Dependencies → Risk
 """
 from __future__ import annotations
+import itertools
+import json
 import logging
+from collections import defaultdict
 from typing import Any
-from uuid import uuid4
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from .base import BaseGenerator, GeneratorConfig
 from .names import NameGenerator
 
 logger = logging.getLogger(__name__)
 
+# Choice pools for the generation loops. Kept as module-level tuples so the
+# hot paths draw from a shared constant instead of building a list literal
+# per entity. Repeated entries weight the draw.
+_ENV_TYPES = ("dev", "staging", "qa", "prod")
+_PLATFORM_CATEGORIES = ("payment", "identity", "data", "messaging", "commerce",
+                        "infrastructure", "security", "observability")
+_STORE_TYPES = ("relational_db", "document_db", "cache", "queue", "search_engine")
+_RECOVERY_PATTERN_TYPES = ("retry", "failover", "rollback", "degraded_mode", "circuit_breaker", "bulkhead")
+
+_PRODUCT_KINDS = ("digital", "cloud", "smart")
+_PRODUCT_STATUSES = ("active", "active", "active", "planned")
+_PRODUCT_TAGS = ("enterprise", "b2b", "b2c", "fintech", "saas", "platform")
+_FEATURE_STATUSES = ("active", "active", "active", "planned", "deprecated")
+_TECH_STACK = ("kubernetes", "docker", "terraform", "helm", "istio", "envoy")
+_CAPABILITY_STATUSES = ("active", "active", "experimental")
+_SERVICE_TYPES = ("rest", "rest", "grpc", "event_driven")
+_EVENT_RETENTIONS = ("7d", "14d", "30d", "90d")
+
+_FLOW_TYPES = ("request_response", "request_response", "event_stream", "saga")
+_INTERFACE_TYPES = ("rest", "grpc", "async_event")
+_PROTOCOLS = ("HTTP/2", "HTTP/1.1", "gRPC", "AMQP")
+_AUTH_TYPES = ("jwt", "api_key", "mtls", "oauth2")
+_STEP_FAILURE_MODES = (None, "timeout", "5xx", "circuit_open")
+
+_DEP_TYPES = ("runtime", "runtime", "data", "event")
+_SEVERITIES = ("critical", "high", "medium", "low")
+_HIGH_SEVERITIES = ("critical", "high", "medium")
+_CRITICALITIES = ("critical", "high", "medium", "medium", "low")
+_FAILURE_TYPES = ("service_unavailable", "latency_spike", "dependency_failure", "resource_exhaustion")
+_RECOVERY_PATHS = ("restart", "failover", "rollback", "scale-up", "circuit-break")
+
+_CPU_REQUESTS = ("250m", "500m", "1000m", "2000m")
+_MEMORY_REQUESTS = ("256Mi", "512Mi", "1Gi", "2Gi")
+_HEALTH_STATUSES = ("healthy", "healthy", "healthy", "degraded")
+# Every (cpu, memory, health) combination — a uniform draw from this table
+# is the same distribution as three independent draws from the columns
+_DEPLOYMENT_SHAPES = tuple(itertools.product(_CPU_REQUESTS, _MEMORY_REQUESTS, _HEALTH_STATUSES))
+
+# Above this many services, dependency dedup switches from a set of index
+# pairs (~80 bytes per edge) to a packed bit matrix (1 bit per possible edge)
+_BITSET_MIN_SERVICES = 4096
+
+
+class _AdjacencyBitset:
+    """Packed n x n adjacency matrix with the add/``in`` interface of a set of pairs."""
+    
+    __slots__ = ("_n", "_bits")
+    
+    def __init__(self, n: int):
+        self._n = n
+        self._bits = bytearray((n * n + 7) >> 3)
+    
+    def add(self, edge: tuple[int, int]) -> None:
+        k = edge[0] * self._n + edge[1]
+        self._bits[k >> 3] |= 1 << (k & 7)
+    
+    def __contains__(self, edge: tuple[int, int]) -> bool:
+        k = edge[0] * self._n + edge[1]
+        return bool(self._bits[k >> 3] >> (k & 7) & 1)
+
 
 class EcosystemGenerator(BaseGenerator):
     """Generates a complete synthetic enterprise ecosystem."""
     
+    # Capability types whose services act as shared hubs in the dependency graph
+    HUB_CATEGORIES = frozenset({"infrastructure", "identity", "observability", "security"})
+    
     def __init__(self, seed: int = 42, size: str = "small", config: GeneratorConfig | None = None):
         super().__init__(seed, config or GeneratorConfig(size))
         self._names = NameGenerator(self._rng)
@@ -41,6 +112,10 @@ class EcosystemGenerator(BaseGenerator):
         self.failure_modes: list[dict[str, Any]] = []
         self.recovery_patterns: list[dict[str, Any]] = []
         self.event_types: list[dict[str, Any]] = []
+        self._summary: dict[str, int] | None = None
+        
+        # Reverse index maintained during generation: capability type -> service indices
+        self._svc_idx_by_cap_type: dict[str, list[int]] = defaultdict(list)
     
     def generate(self) -> dict[str, Any]:
         """Generate the complete ecosystem. Returns all entities."""
@@ -55,15 +130,14 @@ class EcosystemGenerator(BaseGenerator):
         self._generate_risk_metadata()
         self._generate_deployments()
         
-        summary = self._summarize()
-        logger.info("Ecosystem generated: %s", summary)
+        self._summary = None
+        logger.info("Ecosystem generated: %s", self._summarize())
         return self.to_dict()
     
     def _generate_environments(self) -> None:
         """Generate deployment environments."""
-        env_types = ["dev", "staging", "qa", "prod"]
         num_envs = self._config.get("environments", 3)
-        for env_type in env_types[:num_envs]:
+        for env_type in _ENV_TYPES[:num_envs]:
             env = {
                 **self._base_entity(),
                 "name": env_type,
@@ -77,21 +151,21 @@ class EcosystemGenerator(BaseGenerator):
     def _generate_products(self) -> None:
         """Generate products with features."""
         num = self._random_range("products")
-        for _ in range(num):
+        feature_counts = self._random_ranges("features_per_product", num)
+        for num_features in feature_counts:
             product = {
                 **self._base_entity(),
                 "name": self._names.product_name(),
-                "description": f"Enterprise {self._choice(['digital', 'cloud', 'smart'])} product",
-                "status": self._choice(["active", "active", "active", "planned"]),
+                "description": f"Enterprise {self._choice(_PRODUCT_KINDS)} product",
+                "status": self._choice(_PRODUCT_STATUSES),
                 "owner": self._names.team(),
                 "version": self._randint(1, 5),
-                "tags": self._sample(["enterprise", "b2b", "b2c", "fintech", "saas", "platform"], 2),
+                "tags": self._sample(_PRODUCT_TAGS, 2),
                 "features": [],
             }
             self.products.append(product)
 
             # Generate features for this product
-            num_features = self._random_range("features_per_product")
             for _ in range(num_features):
                 feature = {
                     **self._base_entity(),
@@ -99,7 +173,7 @@ class EcosystemGenerator(BaseGenerator):
                     "name": self._names.feature_name(),
                     "description": f"Feature of {product['name']}",
                     "user_flows": [],
-                    "status": self._choice(["active", "active", "active", "planned", "deprecated"]),
+                    "status": self._choice(_FEATURE_STATUSES),
                     "owner": self._names.team(),
                     "depends_on_features": [],
                 }
@@ -109,108 +183,135 @@ class EcosystemGenerator(BaseGenerator):
     def _generate_platforms(self) -> None:
         """Generate platforms → capabilities → services → microservices."""
         num = self._random_range("platforms")
-        categories = list(["payment", "identity", "data", "messaging", "commerce", 
-                          "infrastructure", "security", "observability"])
+        cap_counts = self._random_ranges("capabilities_per_platform", num)
         
-        for i in range(num):
-            cat = categories[i % len(categories)]
-            plat_name, plat_cat = self._names.platform_name(cat)
+        for i, num_caps in enumerate(cap_counts):
+            cat = _PLATFORM_CATEGORIES[i % len(_PLATFORM_CATEGORIES)]
+            subtree = self._build_platform(cat, num_caps)
             
-            platform = {
+            self.platforms.append(subtree["platform"])
+            self.capabilities.extend(subtree["capabilities"])
+            for service in subtree["services"]:
+                self._svc_idx_by_cap_type[cat].append(len(self.services))
+                self.services.append(service)
+            self.microservices.extend(subtree["microservices"])
+            self.event_types.extend(subtree["event_types"])
+        
+        # Assign every service to a random product in one batched draw
+        if self.products:
+            picks = self._rng.choices(range(len(self.products)), k=len(self.services))
+            for service, p in zip(self.services, picks, strict=True):
+                self.products[p]["features"].append(service["id"])
+    
+    def _build_platform(self, cat: str, num_caps: int) -> dict[str, Any]:
+        """Build one platform subtree (capabilities, services, microservices, events).
+        
+        Subtrees never reference each other, so the result is returned for the
+        caller to merge rather than written into the generator's lists. Built
+        serially: all subtrees share the seeded RNG stream and the name
+        registry that keeps names unique across the ecosystem.
+        """
+        plat_name, plat_cat = self._names.platform_name(cat)
+        platform = {
+            **self._base_entity(),
+            "name": plat_name,
+            "description": f"Enterprise {plat_cat} platform",
+            "category": plat_cat,
+            "owner": self._names.team(),
+            "status": "active",
+            "tech_stack": self._sample(_TECH_STACK, 3),
+            "sla_definition": {"availability": self._randfloat(0.99, 0.9999), "response_time_ms": self._randint(50, 500)},
+        }
+        capabilities: list[dict[str, Any]] = []
+        services: list[dict[str, Any]] = []
+        microservices: list[dict[str, Any]] = []
+        event_types: list[dict[str, Any]] = []
+        
+        # Child counts are drawn per level in bulk rather than one RNG call each
+        svc_counts = self._random_ranges("services_per_capability", num_caps)
+        
+        # Generate capabilities for this platform
+        for num_svcs in svc_counts:
+            capability = {
                 **self._base_entity(),
-                "name": plat_name,
-                "description": f"Enterprise {plat_cat} platform",
-                "category": plat_cat,
-                "owner": self._names.team(),
-                "status": "active",
-                "tech_stack": self._sample(["kubernetes", "docker", "terraform", "helm", "istio", "envoy"], 3),
-                "sla_definition": {"availability": self._randfloat(0.99, 0.9999), "response_time_ms": self._randint(50, 500)},
+                "platform_id": platform["id"],
+                "name": self._names.capability_name(cat),
+                "description": f"Capability of {plat_name}",
+                "capability_type": cat,
+                "status": self._choice(_CAPABILITY_STATUSES),
+                "version": f"{self._randint(1,3)}.{self._randint(0,9)}.0",
+                "slo": {},
+                "depends_on_capabilities": [],
             }
-            self.platforms.append(platform)
+            capabilities.append(capability)
             
-            # Generate capabilities for this platform
-            num_caps = self._random_range("capabilities_per_platform")
-            for _ in range(num_caps):
-                capability = {
+            # Generate services for this capability
+            ms_counts = self._random_ranges("microservices_per_service", num_svcs)
+            svc_names = self._names.service_names(cat, num_svcs)
+            for svc_name, num_ms in zip(svc_names, ms_counts, strict=True):
+                lang, framework = self._names.language_and_framework()
+                
+                service = {
                     **self._base_entity(),
+                    "name": svc_name,
+                    "description": f"Service implementing {capability['name']}",
+                    "capability_id": capability["id"],
                     "platform_id": platform["id"],
-                    "name": self._names.capability_name(cat),
-                    "description": f"Capability of {plat_name}",
-                    "capability_type": cat,
-                    "status": self._choice(["active", "active", "experimental"]),
-                    "version": f"{self._randint(1,3)}.{self._randint(0,9)}.0",
-                    "slo": {},
-                    "depends_on_capabilities": [],
+                    "owner": self._names.team(),
+                    "status": "active",
+                    "service_type": self._choice(_SERVICE_TYPES),
+                    "api_version": f"v{self._randint(1,3)}",
+                    "microservice_ids": [],
                 }
-                self.capabilities.append(capability)
+                services.append(service)
                 
-                # Generate services for this capability
-                num_svcs = self._random_range("services_per_capability")
-                for _ in range(num_svcs):
-                    svc_name = self._names.service_name(cat)
-                    lang, framework = self._names.language_and_framework()
+                # Generate microservices
+                for _ in range(num_ms):
+                    ms_name = self._names.microservice_name(svc_name)
+                    ms_lang, ms_fw = self._names.language_and_framework()
                     
-                    service = {
+                    microservice = {
                         **self._base_entity(),
-                        "name": svc_name,
-                        "description": f"Service implementing {capability['name']}",
-                        "capability_id": capability["id"],
-                        "platform_id": platform["id"],
-                        "owner": self._names.team(),
+                        "service_id": service["id"],
+                        "name": ms_name,
+                        "description": f"Microservice of {svc_name}",
+                        "container_image": f"registry.example.com/{ms_name}:{self._randint(1,20)}.{self._randint(0,99)}.{self._randint(0,999)}",
+                        "language": ms_lang,
+                        "framework": ms_fw,
                         "status": "active",
-                        "service_type": self._choice(["rest", "rest", "grpc", "event_driven"]),
-                        "api_version": f"v{self._randint(1,3)}",
-                        "microservice_ids": [],
+                        "repo_url": f"https://github.com/org/{ms_name}",
+                        "dependencies": [],
                     }
-                    self.services.append(service)
-                    
-                    # Assign to a random product
-                    if self.products:
-                        product = self._choice(self.products)
-                        product["features"].append(service["id"])
-                    
-                    # Generate microservices
-                    num_ms = self._random_range("microservices_per_service")
-                    for _ in range(num_ms):
-                        ms_name = self._names.microservice_name(svc_name)
-                        ms_lang, ms_fw = self._names.language_and_framework()
-                        
-                        microservice = {
-                            **self._base_entity(),
-                            "service_id": service["id"],
-                            "name": ms_name,
-                            "description": f"Microservice of {svc_name}",
-                            "container_image": f"registry.example.com/{ms_name}:{self._randint(1,20)}.{self._randint(0,99)}.{self._randint(0,999)}",
-                            "language": ms_lang,
-                            "framework": ms_fw,
-                            "status": "active",
-                            "repo_url": f"https://github.com/org/{ms_name}",
-                            "dependencies": [],
-                        }
-                        self.microservices.append(microservice)
-                        service["microservice_ids"].append(microservice["id"])
-                    
-                    # Generate event types emitted by this service
-                    if self._probability(0.6):
-                        event_type = {
-                            **self._base_entity(),
-                            "name": f"{svc_name.replace('Service', '')}.completed",
-                            "service_id": service["id"],
-                            "description": f"Event emitted by {svc_name}",
-                            "schema_definition": {"type": "object", "properties": {}},
-                            "retention": self._choice(["7d", "14d", "30d", "90d"]),
-                            "status": "active",
-                            "consumed_by_service_ids": [],
-                        }
-                        self.event_types.append(event_type)
+                    microservices.append(microservice)
+                    service["microservice_ids"].append(microservice["id"])
+                
+                # Generate event types emitted by this service
+                if self._probability(0.6):
+                    event_types.append({
+                        **self._base_entity(),
+                        "name": f"{svc_name.replace('Service', '')}.completed",
+                        "service_id": service["id"],
+                        "description": f"Event emitted by {svc_name}",
+                        "schema_definition": {"type": "object", "properties": {}},
+                        "retention": self._choice(_EVENT_RETENTIONS),
+                        "status": "active",
+                        "consumed_by_service_ids": [],
+                    })
+        
+        return {
+            "platform": platform,
+            "capabilities": capabilities,
+            "services": services,
+            "microservices": microservices,
+            "event_types": event_types,
+        }
     
     def _generate_data_stores(self) -> None:
         """Generate data stores and assign to services."""
-        store_types = ["relational_db", "document_db", "cache", "queue", "search_engine"]
         num = self._random_range("data_stores")
         
         for i in range(num):
-            store_type = store_types[i % len(store_types)]
+            store_type = _STORE_TYPES[i % len(_STORE_TYPES)]
             ds_name, technology = self._names.datastore_name(store_type)
             
             data_store = {
@@ -223,9 +324,9 @@ class EcosystemGenerator(BaseGenerator):
             }
             self.data_stores.append(data_store)
             
-            # Create instances in each environment
-            for env in self.environments:
-                instance = {
+            # Create instances in each environment, one extend per store
+            self.data_store_instances.extend([
+                {
                     **self._base_entity(),
                     "data_store_id": data_store["id"],
                     "environment_id": env["id"],
@@ -235,7 +336,8 @@ class EcosystemGenerator(BaseGenerator):
                     "backup_policy": {"enabled": env["env_type"] == "prod", "frequency": "daily"},
                     "status": "active",
                 }
-                self.data_store_instances.append(instance)
+                for env in self.environments
+            ])
     
     def _generate_flows(self) -> None:
         """Generate flows that traverse services."""
@@ -243,15 +345,14 @@ class EcosystemGenerator(BaseGenerator):
             return
         
         num = self._random_range("flows")
-        for _ in range(num):
-            num_steps = self._random_range("steps_per_flow")
+        for num_steps in self._random_ranges("steps_per_flow", num):
             flow_services = self._sample(self.services, min(num_steps + 1, len(self.services)))
             
             flow = {
                 **self._base_entity(),
                 "name": self._names.flow_name(),
                 "description": f"End-to-end flow through {len(flow_services)} services",
-                "flow_type": self._choice(["request_response", "request_response", "event_stream", "saga"]),
+                "flow_type": self._choice(_FLOW_TYPES),
                 "status": "active",
                 "starting_service_id": flow_services[0]["id"],
                 "ending_service_id": flow_services[-1]["id"],
@@ -274,11 +375,11 @@ class EcosystemGenerator(BaseGenerator):
                         from_svc["name"].replace("Service", ""),
                         to_svc["name"].replace("Service", ""),
                     ),
-                    "interface_type": self._choice(["rest", "grpc", "async_event"]),
-                    "protocol": self._choice(["HTTP/2", "HTTP/1.1", "gRPC", "AMQP"]),
+                    "interface_type": self._choice(_INTERFACE_TYPES),
+                    "protocol": self._choice(_PROTOCOLS),
                     "version": "1.0.0",
                     "schema_definition": {},
-                    "authentication": {"type": self._choice(["jwt", "api_key", "mtls", "oauth2"])},
+                    "authentication": {"type": self._choice(_AUTH_TYPES)},
                     "rate_limit": {"requests_per_second": self._randint(100, 10000)},
                     "status": "active",
                 }
@@ -293,7 +394,7 @@ class EcosystemGenerator(BaseGenerator):
                     "interface_id": interface["id"],
                     "status": "active",
                     "average_duration_ms": self._randint(10, 1000),
-                    "failure_mode": self._choice([None, "timeout", "5xx", "circuit_open"]),
+                    "failure_mode": self._choice(_STEP_FAILURE_MODES),
                     "retry_policy": {"max_retries": self._randint(1, 5), "backoff_ms": self._randint(100, 5000)},
                 }
                 self.flow_steps.append(step)
@@ -314,87 +415,96 @@ class EcosystemGenerator(BaseGenerator):
         density = self._config.get("dependency_density", 0.15)
         circular_prob = self._config.get("circular_dep_probability", 0.05)
         
+        # Column views over the services so the loops below work on integer
+        # indices instead of re-reading and comparing whole entity dicts
+        num_services = len(self.services)
+        svc_ids = [s["id"] for s in self.services]
+        svc_names = [s["name"] for s in self.services]
+        existing: set[tuple[int, int]] | _AdjacencyBitset = (
+            _AdjacencyBitset(num_services) if num_services > _BITSET_MIN_SERVICES else set()
+        )
+        
         # Identify hub services (infrastructure, auth, observability)
-        hub_categories = {"infrastructure", "identity", "observability", "security"}
-        hub_services = [s for s in self.services 
-                       if any(c.get("capability_type") in hub_categories 
-                             for c in self.capabilities 
-                             if c["id"] == s.get("capability_id"))]
-        non_hub_services = [s for s in self.services if s not in hub_services]
+        hub_idx = sorted(itertools.chain.from_iterable(
+            self._svc_idx_by_cap_type[t] for t in self.HUB_CATEGORIES
+        ))
+        hub_set = set(hub_idx)
+        non_hub_idx = [i for i in range(num_services) if i not in hub_set]
         
         # Hub-and-spoke: most services depend on hubs
-        for service in non_hub_services:
-            for hub in hub_services:
+        for i in non_hub_idx:
+            batch = []
+            for h in hub_idx:
                 if self._probability(0.4):
-                    dep = {
+                    batch.append({
                         **self._base_entity(),
-                        "source_id": service["id"],
-                        "target_id": hub["id"],
+                        "source_id": svc_ids[i],
+                        "target_id": svc_ids[h],
                         "source_type": "service",
                         "target_type": "service",
                         "dependency_type": "runtime",
-                        "severity": self._choice(["critical", "high", "medium"]),
+                        "severity": self._choice(_HIGH_SEVERITIES),
                         "is_circular": False,
-                        "description": f"{service['name']} depends on {hub['name']}",
-                    }
-                    self.dependencies.append(dep)
+                        "description": f"{svc_names[i]} depends on {svc_names[h]}",
+                    })
+                    existing.add((i, h))
+            self.dependencies.extend(batch)
         
         # Random inter-service dependencies
-        for service in self.services:
-            num_deps = max(0, int(len(self.services) * density) - 1)
-            targets = [s for s in self.services if s["id"] != service["id"]]
-            if targets:
-                dep_targets = self._sample(targets, min(num_deps, len(targets)))
-                for target in dep_targets:
-                    # Check if dependency already exists
-                    existing = any(
-                        d["source_id"] == service["id"] and d["target_id"] == target["id"]
-                        for d in self.dependencies
-                    )
-                    if not existing:
-                        dep = {
+        num_deps = min(max(0, int(num_services * density) - 1), num_services - 1)
+        for i in range(num_services):
+            if num_deps:
+                # Sample indices (one spare so the service itself can be
+                # dropped) instead of rebuilding a targets list per service
+                picks = self._rng.sample(range(num_services), num_deps + 1)
+                batch = []
+                for j in [j for j in picks if j != i][:num_deps]:
+                    if (i, j) not in existing:
+                        batch.append({
                             **self._base_entity(),
-                            "source_id": service["id"],
-                            "target_id": target["id"],
+                            "source_id": svc_ids[i],
+                            "target_id": svc_ids[j],
                             "source_type": "service",
                             "target_type": "service",
-                            "dependency_type": self._choice(["runtime", "runtime", "data", "event"]),
-                            "severity": self._choice(["critical", "high", "medium", "low"]),
+                            "dependency_type": self._choice(_DEP_TYPES),
+                            "severity": self._choice(_SEVERITIES),
                             "is_circular": False,
-                            "description": f"{service['name']} depends on {target['name']}",
-                        }
-                        self.dependencies.append(dep)
+                            "description": f"{svc_names[i]} depends on {svc_names[j]}",
+                        })
+                        existing.add((i, j))
+                self.dependencies.extend(batch)
         
         # Intentional circular dependencies (for testing detection)
-        if len(self.services) >= 3 and self._probability(circular_prob * 5):
-            cycle_size = self._randint(2, min(4, len(self.services)))
-            cycle_services = self._sample(self.services, cycle_size)
-            for i in range(len(cycle_services)):
-                source = cycle_services[i]
-                target = cycle_services[(i + 1) % len(cycle_services)]
-                existing = any(
-                    d["source_id"] == source["id"] and d["target_id"] == target["id"]
-                    for d in self.dependencies
-                )
-                if not existing:
+        if num_services >= 3 and self._probability(circular_prob * 5):
+            cycle_size = self._randint(2, min(4, num_services))
+            cycle = self._rng.sample(range(num_services), cycle_size)
+            for k, i in enumerate(cycle):
+                j = cycle[(k + 1) % len(cycle)]
+                if (i, j) not in existing:
                     dep = {
                         **self._base_entity(),
-                        "source_id": source["id"],
-                        "target_id": target["id"],
+                        "source_id": svc_ids[i],
+                        "target_id": svc_ids[j],
                         "source_type": "service",
                         "target_type": "service",
                         "dependency_type": "runtime",
                         "severity": "high",
                         "is_circular": True,
-                        "description": f"CIRCULAR: {source['name']} -> {target['name']}",
+                        "description": f"CIRCULAR: {svc_names[i]} -> {svc_names[j]}",
                     }
                     self.dependencies.append(dep)
+                    existing.add((i, j))
     
     def _generate_risk_metadata(self) -> None:
         """Generate criticality ratings, SLOs, failure modes, recovery patterns."""
-        for service in self.services:
+        S = len(self.services)
+        svc_ids = [s["id"] for s in self.services]
+        # Blast-radius sizes for every service in one draw; failure modes
+        # then sample indices rather than the service dicts themselves
+        affected_counts = self._choices((1, 2, 3), S)
+        for service, num_affected in zip(self.services, affected_counts, strict=True):
             # Criticality rating
-            criticality = self._choice(["critical", "high", "medium", "medium", "low"])
+            criticality = self._choice(_CRITICALITIES)
             rating = {
                 **self._base_entity(),
                 "entity_id": service["id"],
@@ -427,18 +537,19 @@ class EcosystemGenerator(BaseGenerator):
                     **self._base_entity(),
                     "entity_id": service["id"],
                     "entity_type": "service",
-                    "failure_type": self._choice(["service_unavailable", "latency_spike", "dependency_failure", "resource_exhaustion"]),
+                    "failure_type": self._choice(_FAILURE_TYPES),
                     "probability": self._randfloat(0.001, 0.05),
-                    "severity": self._choice(["critical", "high", "medium"]),
-                    "affected_service_ids": [s["id"] for s in self._sample(self.services, self._randint(1, 3))],
+                    "severity": self._choice(_HIGH_SEVERITIES),
+                    "affected_service_ids": [
+                        svc_ids[j] for j in self._rng.sample(range(S), min(num_affected, S))
+                    ],
                     "description": f"Potential failure in {service['name']}",
-                    "recovery_path": self._sample(["restart", "failover", "rollback", "scale-up", "circuit-break"], 2),
+                    "recovery_path": self._sample(_RECOVERY_PATHS, 2),
                 }
                 self.failure_modes.append(fm)
         
         # Recovery patterns
-        pattern_types = ["retry", "failover", "rollback", "degraded_mode", "circuit_breaker", "bulkhead"]
-        for pt in pattern_types:
+        for pt in _RECOVERY_PATTERN_TYPES:
             pattern = {
                 **self._base_entity(),
                 "name": f"{pt.replace('_', '-')}-pattern",
@@ -452,24 +563,40 @@ class EcosystemGenerator(BaseGenerator):
             self.recovery_patterns.append(pattern)
     
     def _generate_deployments(self) -> None:
-        """Generate deployments for microservices across environments."""
-        for ms in self.microservices:
-            for env in self.environments:
-                deployment = {
-                    **self._base_entity(),
-                    "microservice_id": ms["id"],
-                    "environment_id": env["id"],
-                    "replica_count": 3 if env["env_type"] == "prod" else 1,
-                    "cpu_request": self._choice(["250m", "500m", "1000m", "2000m"]),
-                    "memory_request": self._choice(["256Mi", "512Mi", "1Gi", "2Gi"]),
-                    "status": "running",
-                    "deployed_at": self._random_datetime(30),
-                    "health_status": self._choice(["healthy", "healthy", "healthy", "degraded"]),
-                }
-                self.deployments.append(deployment)
+        """Generate deployments for microservices across environments.
+        
+        A pure microservice x environment cross product: cpu, memory and
+        health come from a single draw over their combination table, and
+        replica counts are fixed per environment, so the dicts are built
+        in a single pass.
+        """
+        n = len(self.microservices) * len(self.environments)
+        shapes = self._choices(_DEPLOYMENT_SHAPES, n)
+        deployed_at = self._random_datetimes(30, n)
+        env_rows = [(env["id"], 3 if env["env_type"] == "prod" else 1)
+                    for env in self.environments]
+        self.deployments = [
+            {
+                **self._base_entity(),
+                "microservice_id": ms["id"],
+                "environment_id": env_id,
+                "replica_count": replicas,
+                "cpu_request": cpu_req,
+                "memory_request": mem_req,
+                "status": "running",
+                "deployed_at": at,
+                "health_status": health_status,
+            }
+            for (ms, (env_id, replicas)), (cpu_req, mem_req, health_status), at in zip(
+                itertools.product(self.microservices, env_rows), shapes, deployed_at, strict=True,
+            )
+        ]
     
     def _summarize(self) -> dict[str, int]:
-        return {
+        """Entity counts, computed once per generate() and reused by exports."""
+        if self._summary is not None:
+            return self._summary
+        self._summary = {
             "products": len(self.products),
             "features": len(self.features),
             "platforms": len(self.platforms),
@@ -489,6 +616,7 @@ class EcosystemGenerator(BaseGenerator):
             "recovery_patterns": len(self.recovery_patterns),
             "event_types": len(self.event_types),
         }
+        return self._summary
     
     def to_dict(self) -> dict[str, Any]:
         """Export complete ecosystem as a dictionary."""
@@ -515,6 +643,25 @@ class EcosystemGenerator(BaseGenerator):
             "recovery_patterns": self.recovery_patterns,
             "event_types": self.event_types,
         }
+    
+    def to_json(self, path: str | None = None) -> str:
+        """Export complete ecosystem as JSON, optionally writing it to path."""
+        result = ecosystem_to_json(self.to_dict())
+        if path:
+            with open(path, "w") as f:
+                f.write(result)
+        return result
+
+
+def ecosystem_to_json(ecosystem: dict[str, Any]) -> str:
+    """Serialize an ecosystem dict to indented JSON.
+
+    Uses orjson when installed (single C-level pass), falling back to the
+    stdlib encoder otherwise.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(ecosystem, default=str, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(ecosystem, indent=2, default=str)
 
 
 def generate_ecosystem(
@@ -533,3 +680,4 @@ def generate_ecosystem(
     gen_config = GeneratorConfig(size, config)
     generator = EcosystemGenerator(seed=seed, size=size, config=gen_config)
     return generator.generate()
+
@@ -5,6 +5,7 @@ products, platforms, services, and microservice names.
 """
 from __future__ import annotations
 import random
+from functools import lru_cache
 from typing import Any
 
 
@@ -16,6 +17,9 @@ PRODUCT_DOMAINS = [
     "supply-chain", "rewards", "notifications", "search", "recommendations",
 ]
 
+# Display form of each domain ("supply-chain" -> "Supply Chain")
+_PRODUCT_DOMAINS_FMT = tuple(d.title().replace("-", " ") for d in PRODUCT_DOMAINS)
+
 PRODUCT_PREFIXES = [
     "Smart", "Next", "Core", "Ultra", "Prime", "Edge", "Cloud",
     "Digital", "Unified", "Global", "Express", "Flex", "Pro", "Max",
@@ -33,6 +37,8 @@ PLATFORM_CATEGORIES = {
     "observability": ["Monitoring Platform", "Logging Hub", "Tracing System", "Alerting Engine"],
 }
 
+_PLATFORM_CATEGORY_KEYS = tuple(PLATFORM_CATEGORIES)
+
 # Service naming patterns
 SERVICE_PATTERNS = {
     "payment": ["PaymentService", "LedgerService", "SettlementService", "ReconciliationService", "RefundService"],
@@ -45,6 +51,32 @@ SERVICE_PATTERNS = {
     "observability": ["MetricsService", "LoggingService", "TracingService", "AlertingService", "DashboardService"],
 }
 
+# Pattern list for categories without their own entry
+_SERVICE_FALLBACK = SERVICE_PATTERNS["infrastructure"]
+
+
+@lru_cache(maxsize=16)
+def _patterns_for(category: str) -> tuple[str, ...]:
+    """Service name patterns for a category, resolved once per category."""
+    return tuple(SERVICE_PATTERNS.get(category, _SERVICE_FALLBACK))
+
+
+def _to_kebab(name: str) -> str:
+    """Convert a CamelCase name to kebab-case."""
+    return "".join(
+        f"-{c.lower()}" if c.isupper() and i > 0 else c.lower()
+        for i, c in enumerate(name)
+    )
+
+
+# Kebab-case microservice base for every known service name, with the
+# trailing "Service" dropped once here rather than on every call
+_MS_BASES = {
+    name: _to_kebab(name.removesuffix("Service"))
+    for names in SERVICE_PATTERNS.values()
+    for name in names
+}
+
 # Microservice naming (suffix patterns)
 MICROSERVICE_SUFFIXES = [
     "-srv", "-api", "-worker", "-gateway", "-processor",
@@ -70,6 +102,8 @@ LANGUAGES = {
     "kotlin": ["Ktor", "Spring Boot", "Micronaut"],
 }
 
+_LANGUAGE_KEYS = tuple(LANGUAGES)
+
 # Data store technologies
 DATA_STORE_TECHNOLOGIES = {
     "relational_db": ["PostgreSQL", "MySQL", "Aurora", "CockroachDB"],
@@ -81,6 +115,41 @@ DATA_STORE_TECHNOLOGIES = {
     "search_engine": ["Elasticsearch", "OpenSearch", "Solr", "Meilisearch"],
 }
 
+# (display name, kebab-case slug) per technology, for datastore names
+_DATA_STORE_KEBAB = {
+    store_type: [(t, t.lower().replace(" ", "-")) for t in techs]
+    for store_type, techs in DATA_STORE_TECHNOLOGIES.items()
+}
+
+# Data store name prefixes
+DATA_STORE_PREFIXES = ["primary", "shared", "dedicated", "global", "regional"]
+
+# Capability names per platform category
+_CAPABILITY_TEMPLATES = {
+    "payment": ("Credit Card Processing", "ACH Transfers", "Wire Transfers", "Digital Wallet", "Subscription Billing", "Invoicing"),
+    "identity": ("OAuth2 Authentication", "SAML SSO", "MFA Verification", "API Key Management", "RBAC", "User Provisioning"),
+    "data": ("Real-time Ingestion", "Batch ETL", "Data Quality", "Schema Registry", "Data Lineage", "Query Federation"),
+    "messaging": ("Email Delivery", "SMS Gateway", "Push Notifications", "In-App Messaging", "Webhook Dispatch", "Event Routing"),
+    "commerce": ("Product Search", "Cart Management", "Checkout Flow", "Pricing Rules", "Inventory Tracking", "Fulfillment"),
+    "infrastructure": ("API Routing", "Rate Limiting", "Circuit Breaking", "Service Discovery", "Config Distribution", "Secret Rotation"),
+    "security": ("Fraud Scoring", "Transaction Monitoring", "PCI Compliance", "Data Encryption", "Access Logging", "Threat Detection"),
+    "observability": ("Metric Collection", "Log Aggregation", "Distributed Tracing", "Alert Management", "SLO Tracking", "Incident Response"),
+}
+_CAPABILITY_DEFAULT = ("General Capability",)
+
+# Feature and flow name parts
+_FEATURE_ACTIONS = ("Real-time", "Automated", "Self-service", "Intelligent", "Unified",
+                    "Adaptive", "Contextual", "Integrated", "Multi-channel", "Predictive")
+_FEATURE_DOMAINS = ("Analytics Dashboard", "Reporting", "Notifications", "Search",
+                    "Personalization", "Document Management", "Workflow Automation",
+                    "Collaboration Hub", "Data Export", "Audit Trail", "User Management",
+                    "API Access", "Billing Portal", "Onboarding Flow", "Access Control",
+                    "Activity Feed", "Performance Insights", "Compliance Reporting",
+                    "Content Delivery", "Configuration Manager")
+_FLOW_ACTIONS = ("Process", "Handle", "Execute", "Complete", "Verify", "Initiate", "Resolve")
+_FLOW_OBJECTS = ("Payment", "Order", "Authentication", "Refund", "Notification", "Transfer",
+                 "Registration", "Checkout", "Subscription", "Invoice", "Claim", "Settlement")
+
 # Cloud regions
 CLOUD_REGIONS = [
     "us-east-1", "us-west-2", "eu-west-1", "eu-central-1",
@@ -99,101 +168,88 @@ TEAMS = [
 class NameGenerator:
     """Generates realistic enterprise system names."""
     
+    __slots__ = ("_rng", "_choice", "_used_names", "_next_suffix")
+    
     def __init__(self, rng: random.Random):
         self._rng = rng
+        # Bound once — every name method draws through it
+        self._choice = rng.choice
         self._used_names: set[str] = set()
+        # Next suffix to try per base name. Names are never released, so
+        # every suffix below it is known to be taken.
+        self._next_suffix: dict[str, int] = {}
     
     def _unique(self, name: str) -> str:
         """Ensure name uniqueness by appending suffix if needed."""
         if name not in self._used_names:
             self._used_names.add(name)
             return name
-        counter = 2
+        counter = self._next_suffix.get(name, 2)
         while f"{name}-{counter}" in self._used_names:
             counter += 1
+        self._next_suffix[name] = counter + 1
         unique = f"{name}-{counter}"
         self._used_names.add(unique)
         return unique
     
     def product_name(self) -> str:
-        prefix = self._rng.choice(PRODUCT_PREFIXES)
-        domain = self._rng.choice(PRODUCT_DOMAINS).title().replace("-", " ")
+        prefix = self._choice(PRODUCT_PREFIXES)
+        domain = self._choice(_PRODUCT_DOMAINS_FMT)
         return self._unique(f"{prefix} {domain}")
     
     def platform_name(self, category: str | None = None) -> tuple[str, str]:
         """Returns (name, category)."""
-        cat = category or self._rng.choice(list(PLATFORM_CATEGORIES.keys()))
+        cat = category or self._choice(_PLATFORM_CATEGORY_KEYS)
         names = PLATFORM_CATEGORIES.get(cat, ["Platform"])
-        name = self._rng.choice(names)
+        name = self._choice(names)
         return self._unique(name), cat
     
     def service_name(self, category: str) -> str:
-        patterns = SERVICE_PATTERNS.get(category, SERVICE_PATTERNS["infrastructure"])
-        name = self._rng.choice(patterns)
-        return self._unique(name)
+        return self._unique(self._choice(_patterns_for(category)))
     
-    def microservice_name(self, service_name: str) -> str:
-        # Convert CamelCase to kebab-case
-        base = ""
-        for i, c in enumerate(service_name):
-            if c.isupper() and i > 0:
-                base += "-"
-            base += c.lower()
-        base = base.replace("service", "").strip("-")
+    def service_names(self, category: str, k: int) -> list[str]:
+        """Draw k service names for a category in one RNG call.
         
-        suffix = self._rng.choice(MICROSERVICE_SUFFIXES)
-        return self._unique(f"{base}{suffix}")
+        Picks are distinct within the pool while k fits in it, so suffixes
+        are only needed for collisions with names already handed out.
+        """
+        pool = _patterns_for(category)
+        picks = self._rng.choices(pool, k=k) if k > len(pool) else self._rng.sample(pool, k)
+        return [self._unique(p) for p in picks]
+    
+    def microservice_name(self, service_name: str) -> str:
+        base = _MS_BASES.get(service_name) or _to_kebab(service_name.removesuffix("Service"))
+        return self._unique(base + self._choice(MICROSERVICE_SUFFIXES))
     
     def datastore_name(self, store_type: str) -> tuple[str, str]:
         """Returns (name, technology)."""
-        techs = DATA_STORE_TECHNOLOGIES.get(store_type, ["Unknown"])
-        tech = self._rng.choice(techs)
-        prefix = self._rng.choice(["primary", "shared", "dedicated", "global", "regional"])
-        name = f"{prefix}-{tech.lower().replace(' ', '-')}"
+        techs = _DATA_STORE_KEBAB.get(store_type, [("Unknown", "unknown")])
+        tech, slug = self._choice(techs)
+        prefix = self._choice(DATA_STORE_PREFIXES)
+        name = f"{prefix}-{slug}"
         return self._unique(name), tech
     
     def team(self) -> str:
-        return self._rng.choice(TEAMS)
+        return self._choice(TEAMS)
     
     def language_and_framework(self) -> tuple[str, str]:
-        lang = self._rng.choice(list(LANGUAGES.keys()))
-        framework = self._rng.choice(LANGUAGES[lang])
+        lang = self._choice(_LANGUAGE_KEYS)
+        framework = self._choice(LANGUAGES[lang])
         return lang, framework
     
     def region(self) -> str:
-        return self._rng.choice(CLOUD_REGIONS)
+        return self._choice(CLOUD_REGIONS)
     
     def capability_name(self, category: str) -> str:
-        templates = {
-            "payment": ["Credit Card Processing", "ACH Transfers", "Wire Transfers", "Digital Wallet", "Subscription Billing", "Invoicing"],
-            "identity": ["OAuth2 Authentication", "SAML SSO", "MFA Verification", "API Key Management", "RBAC", "User Provisioning"],
-            "data": ["Real-time Ingestion", "Batch ETL", "Data Quality", "Schema Registry", "Data Lineage", "Query Federation"],
-            "messaging": ["Email Delivery", "SMS Gateway", "Push Notifications", "In-App Messaging", "Webhook Dispatch", "Event Routing"],
-            "commerce": ["Product Search", "Cart Management", "Checkout Flow", "Pricing Rules", "Inventory Tracking", "Fulfillment"],
-            "infrastructure": ["API Routing", "Rate Limiting", "Circuit Breaking", "Service Discovery", "Config Distribution", "Secret Rotation"],
-            "security": ["Fraud Scoring", "Transaction Monitoring", "PCI Compliance", "Data Encryption", "Access Logging", "Threat Detection"],
-            "observability": ["Metric Collection", "Log Aggregation", "Distributed Tracing", "Alert Management", "SLO Tracking", "Incident Response"],
-        }
-        names = templates.get(category, ["General Capability"])
-        return self._unique(self._rng.choice(names))
+        names = _CAPABILITY_TEMPLATES.get(category, _CAPABILITY_DEFAULT)
+        return self._unique(self._choice(names))
     
     def feature_name(self) -> str:
         """Generate a product feature name."""
-        actions = ["Real-time", "Automated", "Self-service", "Intelligent", "Unified",
-                   "Adaptive", "Contextual", "Integrated", "Multi-channel", "Predictive"]
-        domains = ["Analytics Dashboard", "Reporting", "Notifications", "Search",
-                   "Personalization", "Document Management", "Workflow Automation",
-                   "Collaboration Hub", "Data Export", "Audit Trail", "User Management",
-                   "API Access", "Billing Portal", "Onboarding Flow", "Access Control",
-                   "Activity Feed", "Performance Insights", "Compliance Reporting",
-                   "Content Delivery", "Configuration Manager"]
-        return self._unique(f"{self._rng.choice(actions)} {self._rng.choice(domains)}")
+        return self._unique(f"{self._choice(_FEATURE_ACTIONS)} {self._choice(_FEATURE_DOMAINS)}")
 
     def flow_name(self) -> str:
-        actions = ["Process", "Handle", "Execute", "Complete", "Verify", "Initiate", "Resolve"]
-        objects = ["Payment", "Order", "Authentication", "Refund", "Notification", "Transfer", 
-                   "Registration", "Checkout", "Subscription", "Invoice", "Claim", "Settlement"]
-        return self._unique(f"{self._rng.choice(actions)} {self._rng.choice(objects)}")
+        return self._unique(f"{self._choice(_FLOW_ACTIONS)} {self._choice(_FLOW_OBJECTS)}")
     
     def interface_name(self, provider: str, consumer: str) -> str:
         return self._unique(f"{provider}-to-{consumer}-api")
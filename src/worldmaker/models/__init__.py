@@ -4,74 +4,76 @@ Exports all Pydantic models for the WorldMaker application including
 business entities, platform components, flows, infrastructure, and risk models.
 """
 
-from worldmaker.models.base import (
-    EntityStatus,
-    EntityType,
-    DependencyType,
-    Severity,
-    CriticalityLevel,
-    ServiceType,
-    InterfaceType,
-    EnvironmentType,
-    DataStoreType,
-    DeploymentStatus,
-    HealthStatus,
-    LifecycleEventType,
-    ChangeEventType,
-    ChangeEventStatus,
-    FailureModeType,
-    RecoveryPatternType,
-    FlowType,
-    CapabilityType,
-    BusinessProcessType,
-    BaseEntity,
-    EntityReference,
-)
+import importlib
 
-from worldmaker.models.business import (
-    Product,
-    Feature,
-    BusinessProcess,
-)
-
-from worldmaker.models.platform import (
-    Platform,
-    Capability,
-    Service,
-    Microservice,
-)
-
-from worldmaker.models.flow import (
-    Flow,
-    FlowStep,
-    Interface,
-    EventTypeDefinition,
-)
-
-from worldmaker.models.infrastructure import (
-    Environment,
-    Deployment,
-    DataStore,
-    DataStoreInstance,
-)
-
-from worldmaker.models.dependency import (
-    Dependency,
-    ImpactChain,
-)
-
-from worldmaker.models.lifecycle import (
-    LifecycleEvent,
-    ChangeEvent,
-    VersionTracking,
-)
-
-from worldmaker.models.risk import (
-    CriticalityRating,
-    SLODefinition,
-    FailureMode,
-    RecoveryPattern,
-)
+# Public name -> defining submodule. Submodules (and their pydantic schema
+# builds) load on first attribute access rather than at package import.
+_LAZY = {
+    "EntityStatus": "worldmaker.models.base",
+    "EntityType": "worldmaker.models.base",
+    "DependencyType": "worldmaker.models.base",
+    "Severity": "worldmaker.models.base",
+    "CriticalityLevel": "worldmaker.models.base",
+    "ServiceType": "worldmaker.models.base",
+    "InterfaceType": "worldmaker.models.base",
+    "EnvironmentType": "worldmaker.models.base",
+    "DataStoreType": "worldmaker.models.base",
+    "DeploymentStatus": "worldmaker.models.base",
+    "HealthStatus": "worldmaker.models.base",
+    "LifecycleEventType": "worldmaker.models.base",
+    "ChangeEventType": "worldmaker.models.base",
+    "ChangeEventStatus": "worldmaker.models.base",
+    "FailureModeType": "worldmaker.models.base",
+    "RecoveryPatternType": "worldmaker.models.base",
+    "FlowType": "worldmaker.models.base",
+    "CapabilityType": "worldmaker.models.base",
+    "BusinessProcessType": "worldmaker.models.base",
+    "EntityStatusLit": "worldmaker.models.base",
+    "EntityTypeLit": "worldmaker.models.base",
+    "DependencyTypeLit": "worldmaker.models.base",
+    "SeverityLit": "worldmaker.models.base",
+    "CriticalityLevelLit": "worldmaker.models.base",
+    "ServiceTypeLit": "worldmaker.models.base",
+    "InterfaceTypeLit": "worldmaker.models.base",
+    "EnvironmentTypeLit": "worldmaker.models.base",
+    "DataStoreTypeLit": "worldmaker.models.base",
+    "DeploymentStatusLit": "worldmaker.models.base",
+    "HealthStatusLit": "worldmaker.models.base",
+    "LifecycleEventTypeLit": "worldmaker.models.base",
+    "ChangeEventTypeLit": "worldmaker.models.base",
+    "ChangeEventStatusLit": "worldmaker.models.base",
+    "FailureModeTypeLit": "worldmaker.models.base",
+    "RecoveryPatternTypeLit": "worldmaker.models.base",
+    "FlowTypeLit": "worldmaker.models.base",
+    "CapabilityTypeLit": "worldmaker.models.base",
+    "BusinessProcessTypeLit": "worldmaker.models.base",
+    "BaseEntity": "worldmaker.models.base",
+    "EntityReference": "worldmaker.models.base",
+    "Product": "worldmaker.models.business",
+    "Feature": "worldmaker.models.business",
+    "BusinessProcess": "worldmaker.models.business",
+    "Platform": "worldmaker.models.platform",
+    "Capability": "worldmaker.models.platform",
+    "Service": "worldmaker.models.platform",
+    "Microservice": "worldmaker.models.platform",
+    "Flow": "worldmaker.models.flow",
+    "FlowStep": "worldmaker.models.flow",
+    "Interface": "worldmaker.models.flow",
+    "EventTypeDefinition": "worldmaker.models.flow",
+    "Environment": "worldmaker.models.infrastructure",
+    "Deployment": "worldmaker.models.infrastructure",
+    "DataStore": "worldmaker.models.infrastructure",
+    "DataStoreInstance": "worldmaker.models.infrastructure",
+    "Dependency": "worldmaker.models.dependency",
+    "ImpactChain": "worldmaker.models.dependency",
+    "LifecycleEvent": "worldmaker.models.lifecycle",
+    "ChangeEvent": "worldmaker.models.lifecycle",
+    "VersionTracking": "worldmaker.models.lifecycle",
+    "CriticalityRating": "worldmaker.models.risk",
+    "SLODefinition": "worldmaker.models.risk",
+    "FailureMode": "worldmaker.models.risk",
+    "RecoveryPattern": "worldmaker.models.risk",
+}
 
 __all__ = [
     # Enums and base classes
@@ -94,6 +96,26 @@ __all__ = [
     "FlowType",
     "CapabilityType",
     "BusinessProcessType",
+    # Literal aliases of the enum values, used as field annotations
+    "EntityStatusLit",
+    "EntityTypeLit",
+    "DependencyTypeLit",
+    "SeverityLit",
+    "CriticalityLevelLit",
+    "ServiceTypeLit",
+    "InterfaceTypeLit",
+    "EnvironmentTypeLit",
+    "DataStoreTypeLit",
+    "DeploymentStatusLit",
+    "HealthStatusLit",
+    "LifecycleEventTypeLit",
+    "ChangeEventTypeLit",
+    "ChangeEventStatusLit",
+    "FailureModeTypeLit",
+    "RecoveryPatternTypeLit",
+    "FlowTypeLit",
+    "CapabilityTypeLit",
+    "BusinessProcessTypeLit",
     "BaseEntity",
     "EntityReference",
     # Business models
@@ -128,3 +150,17 @@ __all__ = [
     "FailureMode",
     "RecoveryPattern",
 ]
+
+
+def __getattr__(name: str):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
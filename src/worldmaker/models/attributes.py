@@ -7,7 +7,7 @@ entities missing required attributes as risk signals.
 from __future__ import annotations
 
 from typing import Any, Optional
-from pydantic import Field, ConfigDict
+from pydantic import Field
 
 from worldmaker.models.base import BaseEntity, AttributeTier
 
@@ -21,11 +21,6 @@ class AttributeDefinition(BaseEntity):
     - FUNCTION: Extensible, added by platform owners at runtime
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        use_enum_values=True,
-    )
-
     name: str = Field(..., description="Machine name, e.g. 'risk_classification'")
     display_name: str = Field(..., description="Human-readable name")
     tier: str = Field(..., description="Attribute tier: core, lifecycle, or function")
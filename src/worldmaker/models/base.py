@@ -1,10 +1,14 @@
 """Base entity definitions, enums, and mixins for WorldMaker domain models."""
 
+import os
+from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum
-from uuid import UUID, uuid4
+from uuid import UUID
 from datetime import datetime
-from typing import Any, Optional
-from pydantic import BaseModel, Field, ConfigDict
+from collections.abc import Callable
+from typing import Any, Literal, Optional, get_args
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 
 
 class EntityStatus(str, Enum):
@@ -185,21 +189,131 @@ class BusinessProcessType(str, Enum):
     EXTERNAL = "external"
 
 
+# Field annotations: pydantic-core checks a Literal with a single string
+# membership test, where an Enum field needs enum lookup + use_enum_values.
+# Spelled out so type checkers see them; _check_literals() keeps them in
+# step with the enums.
+EntityStatusLit = Literal["planned", "active", "deprecated", "decommissioned", "sunset"]
+EntityTypeLit = Literal[
+    "product", "feature", "business_process", "platform", "capability", "service",
+    "microservice", "flow", "flow_step", "interface", "event_type", "environment",
+    "deployment", "data_store", "data_store_instance", "dependency",
+    "attribute_definition",
+]
+DependencyTypeLit = Literal["runtime", "build", "data", "event", "deployment", "infrastructure"]
+SeverityLit = Literal["critical", "high", "medium", "low"]
+CriticalityLevelLit = Literal["critical", "high", "medium", "low"]
+ServiceTypeLit = Literal["rest", "grpc", "event_driven", "batch", "graphql"]
+InterfaceTypeLit = Literal["rest", "grpc", "async_event", "webhook", "database", "graphql"]
+EnvironmentTypeLit = Literal["dev", "staging", "qa", "prod"]
+DataStoreTypeLit = Literal[
+    "relational_db", "document_db", "cache", "queue", "blob_storage", "graph_db",
+    "search_engine",
+]
+DeploymentStatusLit = Literal["planned", "running", "paused", "failed"]
+HealthStatusLit = Literal["healthy", "degraded", "unhealthy", "unknown"]
+LifecycleEventTypeLit = Literal["created", "activated", "modified", "deprecated", "decommissioned"]
+ChangeEventTypeLit = Literal[
+    "feature_release", "hotfix", "security_patch", "deprecation", "migration",
+]
+ChangeEventStatusLit = Literal["proposed", "approved", "executing", "completed", "rolled_back"]
+FailureModeTypeLit = Literal[
+    "service_unavailable", "data_loss", "latency_spike", "dependency_failure",
+    "resource_exhaustion", "data_corruption",
+]
+RecoveryPatternTypeLit = Literal[
+    "retry", "failover", "rollback", "degraded_mode", "circuit_breaker", "bulkhead",
+]
+FlowTypeLit = Literal["request_response", "event_stream", "batch", "scheduled", "saga"]
+CapabilityTypeLit = Literal[
+    "compute", "storage", "networking", "integration", "identity", "payment", "messaging",
+    "analytics", "security",
+]
+BusinessProcessTypeLit = Literal["cross_product", "internal", "external"]
+
+
+def _check_literals() -> None:
+    """Check each *Lit alias lists exactly its enum's values, in order.
+
+    Raises TypeError rather than asserting, so the check also runs under -O.
+    """
+    pairs = (
+        (EntityStatusLit, EntityStatus),
+        (EntityTypeLit, EntityType),
+        (DependencyTypeLit, DependencyType),
+        (SeverityLit, Severity),
+        (CriticalityLevelLit, CriticalityLevel),
+        (ServiceTypeLit, ServiceType),
+        (InterfaceTypeLit, InterfaceType),
+        (EnvironmentTypeLit, EnvironmentType),
+        (DataStoreTypeLit, DataStoreType),
+        (DeploymentStatusLit, DeploymentStatus),
+        (HealthStatusLit, HealthStatus),
+        (LifecycleEventTypeLit, LifecycleEventType),
+        (ChangeEventTypeLit, ChangeEventType),
+        (ChangeEventStatusLit, ChangeEventStatus),
+        (FailureModeTypeLit, FailureModeType),
+        (RecoveryPatternTypeLit, RecoveryPatternType),
+        (FlowTypeLit, FlowType),
+        (CapabilityTypeLit, CapabilityType),
+        (BusinessProcessTypeLit, BusinessProcessType),
+    )
+    for alias, enum_cls in pairs:
+        values = tuple(m.value for m in enum_cls)
+        if get_args(alias) != values:
+            raise TypeError(
+                f"Literal alias for {enum_cls.__name__} is out of date: "
+                f"{get_args(alias)} != {values}",
+            )
+
+
+_check_literals()
+
+
+# Entity ids are drawn from os.urandom in 4 KiB blocks (256 ids per syscall)
+# rather than one 16-byte read per uuid4() call
+_UUID_BATCH = 256
+_uuid_pool: list[int] = []
+
+# A forked child must not hand out ids already buffered by its parent
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+
+def _uuid4() -> UUID:
+    """uuid4() equivalent backed by a batched entropy pool.
+
+    list.pop/extend are atomic under the GIL, so concurrent callers never
+    receive the same id; a racing refill only over-fills the pool.
+    """
+    try:
+        n = _uuid_pool.pop()
+    except IndexError:
+        block = os.urandom(16 * _UUID_BATCH)
+        _uuid_pool.extend(
+            int.from_bytes(block[i:i + 16], "big") for i in range(0, len(block), 16)
+        )
+        n = _uuid_pool.pop()
+    return UUID(int=n, version=4)
+
+
+def _now(_utcnow: Callable[[], datetime] = datetime.utcnow) -> datetime:
+    """Timestamp factory; binds utcnow at import to skip the per-call class lookup."""
+    return _utcnow()
+
+
 class BaseEntity(BaseModel):
     """Base for all WorldMaker domain entities."""
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        use_enum_values=True,
-        json_schema_extra={"example": {}},
-    )
+    # Shared by every entity subclass; none re-declare their own config
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
 
-    id: UUID = Field(default_factory=uuid4, description="Unique entity identifier")
+    id: UUID = Field(default_factory=_uuid4, description="Unique entity identifier")
     created_at: datetime = Field(
-        default_factory=datetime.utcnow, description="Creation timestamp"
+        default_factory=_now, description="Creation timestamp"
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow, description="Last update timestamp"
+        default_factory=_now, description="Last update timestamp"
     )
     metadata: dict[str, Any] = Field(
         default_factory=dict, description="Extensible metadata"
@@ -208,10 +322,57 @@ class BaseEntity(BaseModel):
         default="generated", description="Entity layer: core or generated"
     )
 
+    @model_validator(mode="after")
+    def _share_default_timestamps(self) -> "BaseEntity":
+        # A new entity is created and last updated at the same instant
+        fields_set = self.model_fields_set
+        if "created_at" not in fields_set and "updated_at" not in fields_set:
+            object.__setattr__(self, "updated_at", self.created_at)
+        return self
 
-class EntityReference(BaseModel):
-    """Lightweight reference to any entity."""
+
+@dataclass(slots=True, frozen=True)
+class EntityReference:
+    """Lightweight reference to any entity.
+
+    A slotted dataclass rather than a BaseModel: impact chains hold many of
+    these, and pydantic still validates them when they appear as fields.
+    """
 
     id: UUID
-    entity_type: EntityType
+    entity_type: EntityTypeLit
     name: Optional[str] = None
+
+    def model_dump(self) -> dict[str, Any]:
+        return {"id": self.id, "entity_type": self.entity_type, "name": self.name}
+
+
+@lru_cache(maxsize=8192)
+def _make_ref(id_str: str, entity_type: str, name: Optional[str]) -> EntityReference:
+    """Build (or reuse) an EntityReference; safe to share since it is frozen."""
+    return EntityReference(
+        id=UUID(id_str), entity_type=EntityType(entity_type).value, name=name
+    )
+
+
+def _coerce_refs(values: Any) -> Any:
+    """Route raw reference dicts through the _make_ref cache before validation."""
+    if not isinstance(values, list):
+        return values
+    return [
+        _cached_ref(v) if isinstance(v, dict) and "id" in v and "entity_type" in v else v
+        for v in values
+    ]
+
+
+def _cached_ref(value: dict[str, Any]) -> Any:
+    # Only well-formed refs hit the cache; anything else (unhashable fields,
+    # bad ids or types) is passed through for pydantic to report per item
+    ref_id, entity_type, name = value["id"], value["entity_type"], value.get("name")
+    if not (isinstance(ref_id, (str, UUID)) and isinstance(entity_type, str)
+            and (name is None or isinstance(name, str))):
+        return value
+    try:
+        return _make_ref(str(ref_id), entity_type, name)
+    except ValueError:
+        return value
@@ -3,32 +3,30 @@
 from uuid import UUID
 from datetime import datetime
 from typing import Optional
-from pydantic import Field, ConfigDict
+from pydantic import Field, field_validator
 
 from worldmaker.models.base import (
     BaseEntity,
-    EntityType,
-    DependencyType,
+    EntityTypeLit,
+    DependencyTypeLit,
     Severity,
+    SeverityLit,
     EntityReference,
+    _now,
+    _coerce_refs,
 )
 
 
 class Dependency(BaseEntity):
     """Dependency domain entity."""
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        use_enum_values=True,
-    )
-
     source_id: UUID = Field(..., description="Source entity ID")
     target_id: UUID = Field(..., description="Target entity ID")
-    source_type: EntityType = Field(..., description="Source entity type")
-    target_type: EntityType = Field(..., description="Target entity type")
-    dependency_type: DependencyType = Field(..., description="Type of dependency")
-    severity: Severity = Field(
-        default=Severity.MEDIUM, description="Dependency severity"
+    source_type: EntityTypeLit = Field(..., description="Source entity type")
+    target_type: EntityTypeLit = Field(..., description="Target entity type")
+    dependency_type: DependencyTypeLit = Field(..., description="Type of dependency")
+    severity: SeverityLit = Field(
+        default=Severity.MEDIUM.value, description="Dependency severity"
     )
     is_circular: bool = Field(
         default=False, description="Whether this dependency is circular"
@@ -39,13 +37,8 @@ class Dependency(BaseEntity):
 class ImpactChain(BaseEntity):
     """Impact chain domain entity."""
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        use_enum_values=True,
-    )
-
     root_cause_id: UUID = Field(..., description="Root cause entity ID")
-    root_cause_type: EntityType = Field(..., description="Root cause entity type")
+    root_cause_type: EntityTypeLit = Field(..., description="Root cause entity type")
     affected_entities: list[EntityReference] = Field(
         default_factory=list, description="List of affected entities"
     )
@@ -56,5 +49,11 @@ class ImpactChain(BaseEntity):
         default=0, description="Estimated recovery time in minutes"
     )
     last_calculated: datetime = Field(
-        default_factory=datetime.utcnow, description="When this chain was calculated"
+        default_factory=_now, description="When this chain was calculated"
     )
+
+    @field_validator("affected_entities", mode="before")
+    @classmethod
+    def _cached_refs(cls, value):
+        # Reloaded chains repeat the same references; reuse cached instances
+        return _coerce_refs(value)
@@ -2,28 +2,24 @@
 
 from uuid import UUID
 from typing import Any, Optional
-from pydantic import Field, ConfigDict
+from pydantic import Field
 
 from worldmaker.models.base import (
     BaseEntity,
     EntityStatus,
-    FlowType,
-    InterfaceType,
+    EntityStatusLit,
+    FlowTypeLit,
+    InterfaceTypeLit,
 )
 
 
 class Flow(BaseEntity):
     """Flow domain entity."""
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        use_enum_values=True,
-    )
-
     name: str = Field(..., description="Flow name")
     description: Optional[str] = Field(None, description="Flow description")
-    flow_type: FlowType = Field(..., description="Type of flow")
-    status: EntityStatus = Field(..., description="Flow status")
+    flow_type: FlowTypeLit = Field(..., description="Type of flow")
+    status: EntityStatusLit = Field(..., description="Flow status")
     starting_service_id: Optional[UUID] = Field(
         None, description="Starting service ID"
     )
@@ -37,18 +33,13 @@ class Flow(BaseEntity):
 class FlowStep(BaseEntity):
     """Flow step domain entity."""
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        use_enum_values=True,
-    )
-
     flow_id: UUID = Field(..., description="Associated flow ID")
     step_number: int = Field(..., description="Step sequence number")
     from_service_id: UUID = Field(..., description="Source service ID")
     to_service_id: UUID = Field(..., description="Target service ID")
     interface_id: Optional[UUID] = Field(None, description="Interface ID used")
-    status: EntityStatus = Field(
-        default=EntityStatus.ACTIVE, description="Step status"
+    status: EntityStatusLit = Field(
+        default=EntityStatus.ACTIVE.value, description="Step status"
     )
     average_duration_ms: Optional[int] = Field(
         None, description="Average step duration in milliseconds"
@@ -63,15 +54,10 @@ class FlowStep(BaseEntity):
 class Interface(BaseEntity):
     """Interface domain entity."""
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        use_enum_values=True,
-    )
-
     provider_id: UUID = Field(..., description="Provider service ID")
     consumer_id: UUID = Field(..., description="Consumer service ID")
     name: str = Field(..., description="Interface name")
-    interface_type: InterfaceType = Field(..., description="Type of interface")
+    interface_type: InterfaceTypeLit = Field(..., description="Type of interface")
     protocol: str = Field(..., description="Communication protocol")
     version: str = Field(default="1.0.0", description="Interface version")
     schema_definition: dict[str, Any] = Field(
@@ -83,19 +69,14 @@ class Interface(BaseEntity):
     rate_limit: dict[str, Any] = Field(
         default_factory=dict, description="Rate limiting configuration"
     )
-    status: EntityStatus = Field(
-        default=EntityStatus.ACTIVE, description="Interface status"
+    status: EntityStatusLit = Field(
+        default=EntityStatus.ACTIVE.value, description="Interface status"
     )
 
 
 class EventTypeDefinition(BaseEntity):
     """Event type definition domain entity."""
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        use_enum_values=True,
-    )
-
     name: str = Field(..., description="Event type name")
     service_id: UUID = Field(..., description="Publishing service ID")
     description: Optional[str] = Field(None, description="Event type description")
@@ -103,8 +84,8 @@ class EventTypeDefinition(BaseEntity):
         default_factory=dict, description="Event schema definition"
     )
     retention: str = Field(default="30d", description="Event retention period")
-    status: EntityStatus = Field(
-        default=EntityStatus.ACTIVE, description="Event type status"
+    status: EntityStatusLit = Field(
+        default=EntityStatus.ACTIVE.value, description="Event type status"
     )
     consumed_by_service_ids: list[UUID] = Field(
         default_factory=list, description="Services that consume this event type"
@@ -2,72 +2,126 @@
 
 from uuid import UUID
 from datetime import datetime
-from typing import Optional
-from pydantic import Field, ConfigDict
+from collections.abc import Mapping
+from typing import Any, Optional
+from pydantic import Field, computed_field, model_validator
 
 from worldmaker.models.base import (
     BaseEntity,
-    EntityType,
-    LifecycleEventType,
-    ChangeEventType,
+    EntityTypeLit,
+    LifecycleEventTypeLit,
+    ChangeEventTypeLit,
     ChangeEventStatus,
+    ChangeEventStatusLit,
     Severity,
+    SeverityLit,
     EntityReference,
+    _now,
 )
 
 
 class LifecycleEvent(BaseEntity):
     """Lifecycle event domain entity."""
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        use_enum_values=True,
-    )
-
     entity_id: UUID = Field(..., description="Entity ID")
-    entity_type: EntityType = Field(..., description="Entity type")
-    event_type: LifecycleEventType = Field(..., description="Lifecycle event type")
+    entity_type: EntityTypeLit = Field(..., description="Entity type")
+    event_type: LifecycleEventTypeLit = Field(..., description="Lifecycle event type")
     from_state: Optional[str] = Field(None, description="Previous state")
     to_state: str = Field(..., description="New state")
     reason: Optional[str] = Field(None, description="Reason for state change")
     author: str = Field(..., description="Author of the change")
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Event timestamp"
+        default_factory=_now, description="Event timestamp"
     )
 
 
+_AFFECTED_COLUMNS = ("affected_entity_ids", "affected_entity_types", "affected_entity_names")
+
+
 class ChangeEvent(BaseEntity):
     """Change event domain entity."""
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        use_enum_values=True,
-    )
-
     title: str = Field(..., description="Change title")
     description: Optional[str] = Field(None, description="Change description")
-    change_type: ChangeEventType = Field(..., description="Type of change")
+    change_type: ChangeEventTypeLit = Field(..., description="Type of change")
     author: str = Field(..., description="Change author")
-    severity: Severity = Field(default=Severity.MEDIUM, description="Change severity")
-    status: ChangeEventStatus = Field(
-        default=ChangeEventStatus.PROPOSED, description="Change status"
+    severity: SeverityLit = Field(default=Severity.MEDIUM.value, description="Change severity")
+    status: ChangeEventStatusLit = Field(
+        default=ChangeEventStatus.PROPOSED.value, description="Change status"
+    )
+    # Affected entities are held as parallel columns rather than a list of
+    # EntityReference objects. The columns stay out of dumps: the public
+    # shape is the affected_entities list, rebuilt by the computed field
+    affected_entity_ids: list[UUID] = Field(
+        default_factory=list, exclude=True, description="IDs of affected entities"
     )
-    affected_entities: list[EntityReference] = Field(
-        default_factory=list, description="Affected entities"
+    affected_entity_types: list[EntityTypeLit] = Field(
+        default_factory=list, exclude=True,
+        description="Entity types, parallel to affected_entity_ids",
+    )
+    affected_entity_names: list[Optional[str]] = Field(
+        default_factory=list, exclude=True,
+        description="Entity names, parallel to affected_entity_ids",
     )
     completed_at: Optional[datetime] = Field(None, description="Completion timestamp")
 
+    @model_validator(mode="before")
+    @classmethod
+    def _split_affected_entities(cls, data: Any) -> Any:
+        # Accept the list-of-references shape and split it into the columns
+        if not (isinstance(data, dict) and "affected_entities" in data):
+            return data
+        data = dict(data)
+        refs = data.pop("affected_entities") or []
+        given = [c for c in _AFFECTED_COLUMNS if c in data]
+        if given:
+            raise ValueError(f"affected_entities cannot be combined with {', '.join(given)}")
+        if not isinstance(refs, list):
+            raise ValueError("affected_entities must be a list of entity references")
+        ids, types, names = [], [], []
+        for i, ref in enumerate(refs):
+            if isinstance(ref, EntityReference):
+                ref = ref.model_dump()
+            if not isinstance(ref, Mapping) or "id" not in ref or "entity_type" not in ref:
+                raise ValueError(
+                    f"affected_entities[{i}] must be a mapping with 'id' and 'entity_type'",
+                )
+            ids.append(ref["id"])
+            types.append(ref["entity_type"])
+            names.append(ref.get("name"))
+        data.update(zip(_AFFECTED_COLUMNS, (ids, types, names), strict=True))
+        return data
+
+    @model_validator(mode="after")
+    def _check_affected_columns(self) -> "ChangeEvent":
+        n = len(self.affected_entity_ids)
+        if len(self.affected_entity_types) != n:
+            raise ValueError("affected_entity_ids and affected_entity_types must be the same length")
+        if not self.affected_entity_names:
+            # Names are optional when the columns are given directly
+            self.affected_entity_names = [None] * n
+        elif len(self.affected_entity_names) != n:
+            raise ValueError("affected_entity_names must be empty or match affected_entity_ids")
+        return self
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def affected_entities(self) -> list[EntityReference]:
+        """Affected entities as EntityReference objects, built on demand."""
+        return [
+            EntityReference(id=entity_id, entity_type=entity_type, name=name)
+            for entity_id, entity_type, name in zip(
+                self.affected_entity_ids, self.affected_entity_types,
+                self.affected_entity_names, strict=True,
+            )
+        ]
+
 
 class VersionTracking(BaseEntity):
     """Version tracking domain entity."""
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        use_enum_values=True,
-    )
-
     entity_id: UUID = Field(..., description="Entity ID")
-    entity_type: EntityType = Field(..., description="Entity type")
+    entity_type: EntityTypeLit = Field(..., description="Entity type")
     version: str = Field(..., description="Version string")
     version_hash: Optional[str] = Field(None, description="Hash of version content")
     previous_version: Optional[str] = Field(None, description="Previous version")
@@ -3,29 +3,24 @@
 from uuid import UUID
 from datetime import datetime
 from typing import Any, Optional
-from pydantic import Field, ConfigDict
+from pydantic import Field
 
 from worldmaker.models.base import (
     BaseEntity,
-    EntityType,
-    CriticalityLevel,
-    Severity,
-    FailureModeType,
-    RecoveryPatternType,
+    EntityTypeLit,
+    CriticalityLevelLit,
+    SeverityLit,
+    FailureModeTypeLit,
+    RecoveryPatternTypeLit,
 )
 
 
 class CriticalityRating(BaseEntity):
     """Criticality rating domain entity."""
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        use_enum_values=True,
-    )
-
     entity_id: UUID = Field(..., description="Entity ID")
-    entity_type: EntityType = Field(..., description="Entity type")
-    criticality: CriticalityLevel = Field(..., description="Criticality level")
+    entity_type: EntityTypeLit = Field(..., description="Entity type")
+    criticality: CriticalityLevelLit = Field(..., description="Criticality level")
     business_impact: Optional[str] = Field(None, description="Business impact")
     risk_score: float = Field(
         default=0.0, ge=0.0, le=10.0, description="Risk score (0-10)"
@@ -39,13 +34,8 @@ class CriticalityRating(BaseEntity):
 class SLODefinition(BaseEntity):
     """SLO definition domain entity."""
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        use_enum_values=True,
-    )
-
     entity_id: UUID = Field(..., description="Entity ID")
-    entity_type: EntityType = Field(..., description="Entity type")
+    entity_type: EntityTypeLit = Field(..., description="Entity type")
     availability: float = Field(
         default=0.999, ge=0.0, le=1.0, description="Availability target"
     )
@@ -63,18 +53,13 @@ class SLODefinition(BaseEntity):
 class FailureMode(BaseEntity):
     """Failure mode domain entity."""
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        use_enum_values=True,
-    )
-
     entity_id: UUID = Field(..., description="Entity ID")
-    entity_type: EntityType = Field(..., description="Entity type")
-    failure_type: FailureModeType = Field(..., description="Type of failure")
+    entity_type: EntityTypeLit = Field(..., description="Entity type")
+    failure_type: FailureModeTypeLit = Field(..., description="Type of failure")
     probability: float = Field(
         default=0.01, ge=0.0, le=1.0, description="Probability of failure"
     )
-    severity: Severity = Field(..., description="Failure severity")
+    severity: SeverityLit = Field(..., description="Failure severity")
     affected_service_ids: list[UUID] = Field(
         default_factory=list, description="Affected service IDs"
     )
@@ -87,14 +72,9 @@ class FailureMode(BaseEntity):
 class RecoveryPattern(BaseEntity):
     """Recovery pattern domain entity."""
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        use_enum_values=True,
-    )
-
     name: str = Field(..., description="Recovery pattern name")
     description: Optional[str] = Field(None, description="Pattern description")
-    pattern_type: RecoveryPatternType = Field(..., description="Type of pattern")
+    pattern_type: RecoveryPatternTypeLit = Field(..., description="Type of pattern")
     failure_mode_id: Optional[UUID] = Field(
         None, description="Associated failure mode ID"
     )
@@ -1,7 +1,10 @@
 """Pytest configuration and fixtures for WorldMaker tests."""
 from __future__ import annotations
 
+import pickle
 import pytest
+from collections.abc import Callable
+from functools import cache
 from typing import Any
 
 from worldmaker.db.memory import InMemoryStore, reset_store
@@ -9,17 +12,67 @@ from worldmaker.engine.trace import TraceEngine
 from worldmaker.generators.ecosystem import generate_ecosystem
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_code_repos(tmp_path_factory):
+    """Scaffold code repos under a per-session temp dir, never the checkout.
+
+    tmp_path_factory is per worker under pytest-xdist, so parallel workers
+    never scaffold into or clear each other's repos.
+    """
+    from worldmaker.api import deps
+    from worldmaker.config import settings
+
+    original = settings.CODE_REPO_PATH
+    settings.CODE_REPO_PATH = str(tmp_path_factory.mktemp("code_repos"))
+    deps._code_repo_mgr = None
+    yield
+    settings.CODE_REPO_PATH = original
+    deps._code_repo_mgr = None
+
+
 @pytest.fixture
 def store() -> InMemoryStore:
     """Provide a clean in-memory store for each test."""
     return reset_store()
 
 
+@cache
+def _ecosystem_blob(seed: int, size: str) -> bytes:
+    """Generate a preset ecosystem once per session, pickled.
+
+    Unpickling a fresh copy is several times cheaper than regenerating it,
+    and keeps tests isolated from each other's mutations.
+    """
+    eco = generate_ecosystem(seed=seed, size=size)
+    return pickle.dumps(eco, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+@pytest.fixture(scope="session")
+def ecosystem_factory() -> Callable[[int, str], dict[str, Any]]:
+    """Return fresh copies of preset ecosystems, generating each only once."""
+    def factory(seed: int = 42, size: str = "small") -> dict[str, Any]:
+        return pickle.loads(_ecosystem_blob(seed, size))
+    return factory
+
+
+@pytest.fixture(scope="session")
+def _small_ecosystem_blob() -> bytes:
+    """The seed-42 small ecosystem, pickled."""
+    return _ecosystem_blob(42, "small")
+
+
+@pytest.fixture(scope="session")
+def _seeded_store_blob(_small_ecosystem_blob: bytes) -> bytes:
+    """Load the small ecosystem into a store once per session and snapshot it."""
+    seeded = InMemoryStore()
+    seeded.load_ecosystem(pickle.loads(_small_ecosystem_blob))
+    return seeded.snapshot()
+
+
 @pytest.fixture
-def seeded_store(store: InMemoryStore) -> InMemoryStore:
+def seeded_store(store: InMemoryStore, _seeded_store_blob: bytes) -> InMemoryStore:
     """Provide a store pre-loaded with a small generated ecosystem."""
-    eco = generate_ecosystem(seed=42, size="small")
-    store.load_ecosystem(eco)
+    store.restore(_seeded_store_blob)
     return store
 
 
@@ -36,12 +89,12 @@ def seeded_engine(seeded_store: InMemoryStore) -> TraceEngine:
 
 
 @pytest.fixture
-def small_ecosystem() -> dict[str, Any]:
-    """Generate and return a small ecosystem dict."""
-    return generate_ecosystem(seed=42, size="small")
+def small_ecosystem(_small_ecosystem_blob: bytes) -> dict[str, Any]:
+    """Return a fresh copy of the small seed-42 ecosystem dict."""
+    return pickle.loads(_small_ecosystem_blob)
 
 
 @pytest.fixture
-def medium_ecosystem() -> dict[str, Any]:
-    """Generate and return a medium ecosystem dict."""
-    return generate_ecosystem(seed=42, size="medium")
+def medium_ecosystem(ecosystem_factory) -> dict[str, Any]:
+    """Return a fresh copy of the medium seed-42 ecosystem dict."""
+    return ecosystem_factory(42, "medium")
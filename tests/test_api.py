@@ -15,11 +15,17 @@ except ImportError:
 pytestmark = pytest.mark.skipif(not HAS_FASTAPI, reason="FastAPI not installed")
 
 
+@pytest.fixture(scope="session")
+def api_app():
+    """Build the FastAPI app once; tests only swap its dependency overrides."""
+    return create_app()
+
+
 @pytest.fixture
-def client():
+def client(api_app):
     """Create a test client with a clean store."""
     reset_all()
-    app = create_app()
+    app = api_app
 
     from worldmaker.engine.trace import TraceEngine
 
@@ -38,17 +44,15 @@ def client():
 
 
 @pytest.fixture
-def seeded_client():
+def seeded_client(api_app, _seeded_store_blob):
     """Create a test client with a pre-loaded ecosystem."""
     reset_all()
-    app = create_app()
+    app = api_app
 
-    from worldmaker.generators.ecosystem import generate_ecosystem
     from worldmaker.engine.trace import TraceEngine
 
     store = InMemoryStore()
-    eco = generate_ecosystem(seed=42, size="small")
-    store.load_ecosystem(eco)
+    store.restore(_seeded_store_blob)
 
     engine = TraceEngine(store=store, rng_seed=42)
 
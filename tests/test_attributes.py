@@ -18,81 +18,94 @@ import pytest
 from worldmaker.db.memory import InMemoryStore
 from worldmaker.generators.core_attributes import (
     bootstrap_core_attributes,
+    index_attributes,
     ALL_ATTRIBUTES,
 )
 
 
+_VALID_TYPES = frozenset({"string", "number", "boolean", "enum", "json"})
+
+
 @pytest.fixture
 def store() -> InMemoryStore:
     """Provide a fresh in-memory store."""
     return InMemoryStore()
 
 
+@pytest.fixture(scope="session")
+def _attr_store_blob() -> bytes:
+    """Bootstrap core attributes once per session and snapshot the store."""
+    template = InMemoryStore()
+    # No attribute test reads the bootstrap's own audit entries
+    with template.audit_disabled():
+        bootstrap_core_attributes(template)
+    return template.snapshot()
+
+
+@pytest.fixture(scope="session")
+def attr_defs(_attr_store_blob: bytes) -> tuple[dict, ...]:
+    """Bootstrapped attribute definitions, read once for read-only tests."""
+    template = InMemoryStore()
+    template.restore(_attr_store_blob)
+    return tuple(template.get_all("attribute_definition", limit=1000))
+
+
+@pytest.fixture(scope="session")
+def attr_index(attr_defs: tuple[dict, ...]) -> dict:
+    """Bootstrapped definitions grouped by tier and entity type."""
+    return index_attributes(attr_defs)
+
+
 @pytest.fixture
-def attr_store(store: InMemoryStore) -> InMemoryStore:
+def attr_store(store: InMemoryStore, _attr_store_blob: bytes) -> InMemoryStore:
     """Provide a store with core attributes bootstrapped."""
-    bootstrap_core_attributes(store)
+    store.restore(_attr_store_blob)
     return store
 
 
 class TestBootstrap:
     """Tests for attribute definition bootstrap."""
 
-    def test_bootstrap_creates_attribute_definitions(self, attr_store: InMemoryStore):
-        attrs = attr_store.get_all("attribute_definition", limit=1000)
-        assert len(attrs) >= 20  # 5 core + 12 lifecycle + 3 function
+    def test_bootstrap_creates_attribute_definitions(self, attr_defs):
+        assert len(attr_defs) >= 20  # 5 core + 12 lifecycle + 3 function
 
-    def test_bootstrap_creates_correct_tiers(self, attr_store: InMemoryStore):
-        attrs = attr_store.get_all("attribute_definition", limit=1000)
-        tiers = {a["tier"] for a in attrs}
+    def test_bootstrap_creates_correct_tiers(self, attr_defs):
+        tiers = {a["tier"] for a in attr_defs}
         assert "core" in tiers
         assert "lifecycle" in tiers
         assert "function" in tiers
 
-    def test_bootstrap_core_count(self, attr_store: InMemoryStore):
-        core_attrs = [
-            a for a in attr_store.get_all("attribute_definition", limit=1000)
-            if a.get("tier") == "core"
-        ]
+    def test_bootstrap_core_count(self, attr_index):
+        core_attrs = attr_index["by_tier"]["core"]
         assert len(core_attrs) == 5
 
-    def test_bootstrap_lifecycle_count(self, attr_store: InMemoryStore):
-        lifecycle_attrs = [
-            a for a in attr_store.get_all("attribute_definition", limit=1000)
-            if a.get("tier") == "lifecycle"
-        ]
+    def test_bootstrap_lifecycle_count(self, attr_index):
+        lifecycle_attrs = attr_index["by_tier"]["lifecycle"]
         assert len(lifecycle_attrs) == 12
 
-    def test_bootstrap_function_count(self, attr_store: InMemoryStore):
-        func_attrs = [
-            a for a in attr_store.get_all("attribute_definition", limit=1000)
-            if a.get("tier") == "function"
-        ]
+    def test_bootstrap_function_count(self, attr_index):
+        func_attrs = attr_index["by_tier"]["function"]
         assert len(func_attrs) == 3
 
     def test_bootstrap_idempotent(self, store: InMemoryStore):
         result1 = bootstrap_core_attributes(store)
-        count1 = len(store.get_all("attribute_definition", limit=1000))
+        count1 = store.count("attribute_definition")
 
         result2 = bootstrap_core_attributes(store)
-        count2 = len(store.get_all("attribute_definition", limit=1000))
+        count2 = store.count("attribute_definition")
 
         assert count1 == count2
         assert result2.get("skipped") is True
 
-    def test_bootstrap_all_have_layer_core(self, attr_store: InMemoryStore):
-        attrs = attr_store.get_all("attribute_definition", limit=1000)
-        for attr in attrs:
+    def test_bootstrap_all_have_layer_core(self, attr_defs):
+        for attr in attr_defs:
             assert attr.get("layer") == "core", f"Attribute {attr['name']} missing layer=core"
 
     def test_all_attributes_constant_matches_bootstrap(self):
         assert len(ALL_ATTRIBUTES) >= 20
 
-    def test_core_attributes_are_required(self, attr_store: InMemoryStore):
-        core_attrs = [
-            a for a in attr_store.get_all("attribute_definition", limit=1000)
-            if a.get("tier") == "core"
-        ]
+    def test_core_attributes_are_required(self, attr_index):
+        core_attrs = attr_index["by_tier"]["core"]
         for attr in core_attrs:
             assert attr.get("required") is True, f"Core attr {attr['name']} should be required"
 
@@ -100,7 +113,7 @@ class TestBootstrap:
 class TestGapAnalysis:
     """Tests for gap detection — the risk signal."""
 
-    def test_gap_analysis_detects_missing(self, attr_store: InMemoryStore):
+    def test_gap_analysis_detects_missing(self, attr_store: InMemoryStore, attr_index):
         """Entity without required attributes shows up in gaps."""
         # Create a service with empty metadata
         attr_store.create("service", {
@@ -110,11 +123,7 @@ class TestGapAnalysis:
         })
 
         # Get required attributes for services
-        all_attrs = attr_store.get_all("attribute_definition", limit=1000)
-        required_for_service = [
-            a for a in all_attrs
-            if a.get("required") and "service" in a.get("applies_to", [])
-        ]
+        required_for_service = attr_index["required_by_entity"]["service"]
 
         # Should have at least some required attrs
         assert len(required_for_service) > 0
@@ -131,13 +140,9 @@ class TestGapAnalysis:
         ]
         assert len(missing) > 0, "Service should be missing required attributes"
 
-    def test_gap_analysis_clean(self, attr_store: InMemoryStore):
+    def test_gap_analysis_clean(self, attr_store: InMemoryStore, attr_index):
         """Entity with all required attributes has no gaps."""
-        all_attrs = attr_store.get_all("attribute_definition", limit=1000)
-        required_for_service = [
-            a for a in all_attrs
-            if a.get("required") and "service" in a.get("applies_to", [])
-        ]
+        required_for_service = attr_index["required_by_entity"]["service"]
 
         # Build metadata with all required values populated
         metadata = {}
@@ -151,7 +156,7 @@ class TestGapAnalysis:
         })
 
         # Verify this service has no missing required attributes
-        services = attr_store.search("service", "compliant-service")
+        services = attr_store.get_by_attr("service", "name", "compliant-service")
         assert len(services) == 1
         svc = services[0]
         svc_metadata = svc.get("metadata", {})
@@ -173,16 +178,17 @@ class TestStamping:
             "status": "active",
             "metadata": {},
         })
+        svc_id = svc["id"]
 
         # Stamp an attribute value
-        entity = attr_store.get("service", str(svc["id"]))
+        entity = attr_store.get("service", svc_id)
         metadata = entity.get("metadata", {})
         metadata["risk_classification"] = "high"
         metadata["risk_classification_stamped_by"] = "Security Management"
-        attr_store.update("service", str(svc["id"]), {"metadata": metadata})
+        attr_store.update("service", svc_id, {"metadata": metadata})
 
         # Verify
-        updated = attr_store.get("service", str(svc["id"]))
+        updated = attr_store.get("service", svc_id)
         assert updated["metadata"]["risk_classification"] == "high"
         assert updated["metadata"]["risk_classification_stamped_by"] == "Security Management"
 
@@ -193,16 +199,17 @@ class TestStamping:
             "status": "active",
             "metadata": {},
         })
+        svc_id = svc["id"]
 
-        initial_audit_count = len(attr_store.get_audit_log(entity_id=str(svc["id"])))
+        initial_audit_count = len(attr_store.get_audit_log(entity_id=svc_id))
 
         # Stamp
-        entity = attr_store.get("service", str(svc["id"]))
+        entity = attr_store.get("service", svc_id)
         metadata = entity.get("metadata", {})
         metadata["criticality_tier"] = "tier1"
-        attr_store.update("service", str(svc["id"]), {"metadata": metadata})
+        attr_store.update("service", svc_id, {"metadata": metadata})
 
-        audit = attr_store.get_audit_log(entity_id=str(svc["id"]))
+        audit = attr_store.get_audit_log(entity_id=svc_id)
         assert len(audit) > initial_audit_count
 
     def test_stamp_overwrites_previous_value(self, attr_store: InMemoryStore):
@@ -211,15 +218,16 @@ class TestStamping:
             "status": "active",
             "metadata": {"risk_classification": "low"},
         })
+        svc_id = svc["id"]
 
-        entity = attr_store.get("service", str(svc["id"]))
+        entity = attr_store.get("service", svc_id)
         metadata = entity.get("metadata", {})
         assert metadata["risk_classification"] == "low"
 
         metadata["risk_classification"] = "critical"
-        attr_store.update("service", str(svc["id"]), {"metadata": metadata})
+        attr_store.update("service", svc_id, {"metadata": metadata})
 
-        updated = attr_store.get("service", str(svc["id"]))
+        updated = attr_store.get("service", svc_id)
         assert updated["metadata"]["risk_classification"] == "critical"
 
 
@@ -228,12 +236,12 @@ class TestLayerProtection:
 
     def test_core_attributes_survive_reset(self, attr_store: InMemoryStore):
         """clear_layer('generated') preserves core attribute definitions."""
-        before = len(attr_store.get_all("attribute_definition", limit=1000))
+        before = attr_store.count("attribute_definition")
         assert before >= 20
 
         attr_store.clear_layer("generated")
 
-        after = len(attr_store.get_all("attribute_definition", limit=1000))
+        after = attr_store.count("attribute_definition")
         assert after == before, "Core attribute definitions should survive reset"
 
     def test_generated_entities_cleared_but_attrs_preserved(self, attr_store: InMemoryStore):
@@ -245,15 +253,12 @@ class TestLayerProtection:
             "layer": "generated",
             "metadata": {},
         })
-        assert len(attr_store.get_all("service", limit=100)) >= 1
+        assert attr_store.count("service") >= 1
 
         attr_store.clear_layer("generated")
 
         # Generated services are gone
-        gen_services = [
-            s for s in attr_store.get_all("service", limit=100)
-            if s.get("layer") == "generated"
-        ]
+        gen_services = attr_store.get_by_attr("service", "layer", "generated")
         assert len(gen_services) == 0
 
         # Core attributes remain
@@ -292,17 +297,14 @@ class TestFunctionTierCrud:
         deleted = attr_store.delete("attribute_definition", str(new_attr["id"]))
         assert deleted is True
 
-    def test_cannot_delete_core_attribute_logic(self, attr_store: InMemoryStore):
+    def test_cannot_delete_core_attribute_logic(self, attr_index):
         """Core-tier attributes should be protected from deletion in the API layer.
 
         Note: The store itself doesn't enforce tier protection —
         that's the API route's responsibility. This test verifies the data
         that would be checked by the API endpoint.
         """
-        core_attrs = [
-            a for a in attr_store.get_all("attribute_definition", limit=1000)
-            if a.get("tier") == "core"
-        ]
+        core_attrs = attr_index["by_tier"]["core"]
         assert len(core_attrs) > 0
 
         for attr in core_attrs:
@@ -314,41 +316,32 @@ class TestFunctionTierCrud:
 class TestAttributeMetadata:
     """Tests for attribute definition quality."""
 
-    def test_all_attributes_have_name(self, attr_store: InMemoryStore):
-        attrs = attr_store.get_all("attribute_definition", limit=1000)
-        for attr in attrs:
+    def test_all_attributes_have_name(self, attr_defs):
+        for attr in attr_defs:
             assert attr.get("name"), f"Attribute {attr.get('id')} missing name"
 
-    def test_all_attributes_have_display_name(self, attr_store: InMemoryStore):
-        attrs = attr_store.get_all("attribute_definition", limit=1000)
-        for attr in attrs:
+    def test_all_attributes_have_display_name(self, attr_defs):
+        for attr in attr_defs:
             assert attr.get("display_name"), f"Attribute {attr['name']} missing display_name"
 
-    def test_all_attributes_have_applies_to(self, attr_store: InMemoryStore):
-        attrs = attr_store.get_all("attribute_definition", limit=1000)
-        for attr in attrs:
+    def test_all_attributes_have_applies_to(self, attr_defs):
+        for attr in attr_defs:
             assert len(attr.get("applies_to", [])) > 0, \
                 f"Attribute {attr['name']} has no applies_to"
 
-    def test_all_attributes_have_data_type(self, attr_store: InMemoryStore):
-        attrs = attr_store.get_all("attribute_definition", limit=1000)
-        valid_types = {"string", "number", "boolean", "enum", "json"}
-        for attr in attrs:
-            assert attr.get("data_type") in valid_types, \
+    def test_all_attributes_have_data_type(self, attr_defs):
+        for attr in attr_defs:
+            assert attr.get("data_type") in _VALID_TYPES, \
                 f"Attribute {attr['name']} has invalid data_type: {attr.get('data_type')}"
 
-    def test_enum_attributes_have_values(self, attr_store: InMemoryStore):
-        attrs = attr_store.get_all("attribute_definition", limit=1000)
-        for attr in attrs:
+    def test_enum_attributes_have_values(self, attr_defs):
+        for attr in attr_defs:
             if attr.get("data_type") == "enum":
                 assert len(attr.get("enum_values", [])) > 0, \
                     f"Enum attribute {attr['name']} has no enum_values"
 
-    def test_lifecycle_attributes_have_owner(self, attr_store: InMemoryStore):
-        lifecycle_attrs = [
-            a for a in attr_store.get_all("attribute_definition", limit=1000)
-            if a.get("tier") == "lifecycle"
-        ]
+    def test_lifecycle_attributes_have_owner(self, attr_index):
+        lifecycle_attrs = attr_index["by_tier"]["lifecycle"]
         for attr in lifecycle_attrs:
             assert attr.get("owner_platform"), \
                 f"Lifecycle attribute {attr['name']} missing owner_platform"
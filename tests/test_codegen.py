@@ -11,12 +11,11 @@ Verifies:
 from __future__ import annotations
 
 import os
-import shutil
-import tempfile
+from pathlib import Path
 
 import pytest
 
-from worldmaker.codegen.manager import CodeRepoManager
+from worldmaker.codegen.manager import CodeRepoManager, MemoryBackend
 from worldmaker.codegen.templates import (
     LANGUAGE_TEMPLATES,
     generate_handler,
@@ -36,7 +35,13 @@ def tmp_repo_path(tmp_path):
 
 @pytest.fixture
 def code_mgr(tmp_repo_path):
-    """Provide a CodeRepoManager with temp path."""
+    """Provide an in-memory CodeRepoManager; file content needs no disk."""
+    return CodeRepoManager(base_path=tmp_repo_path, backend="memory")
+
+
+@pytest.fixture
+def disk_code_mgr(tmp_repo_path):
+    """Provide a CodeRepoManager writing real files under a temp path."""
     return CodeRepoManager(base_path=tmp_repo_path)
 
 
@@ -58,6 +63,30 @@ def _make_microservice(
     }
 
 
+# (language, framework, expected files, handler source fragments)
+LANG_CASES = [
+    ("python", "FastAPI", {"handler.py", "requirements.txt"}, ("handle_event", "__metadata__")),
+    ("go", "Gin", {"main.go", "go.mod"}, ("Gin",)),
+    ("java", "Spring Boot", {"Handler.java", "pom.xml"}, ()),
+    ("typescript", "NestJS", {"handler.ts", "package.json"}, ()),
+    ("rust", "Actix", {"main.rs", "Cargo.toml"}, ()),
+    ("kotlin", "Ktor", {"Application.kt", "build.gradle.kts"}, ()),
+]
+
+
+@pytest.fixture(scope="module")
+def shared_code_mgr(tmp_path_factory):
+    """One in-memory manager for cases that each scaffold a distinct repo name."""
+    return CodeRepoManager(base_path=str(tmp_path_factory.mktemp("repos")), backend="memory")
+
+
+@pytest.fixture(scope="module")
+def scaffolded_code_mgr(shared_code_mgr):
+    """The shared manager with "order-processor" scaffolded once, for read-only tests."""
+    shared_code_mgr.scaffold(_make_microservice())
+    return shared_code_mgr
+
+
 class TestScaffold:
     """Tests for code scaffolding."""
 
@@ -75,59 +104,22 @@ class TestScaffold:
         assert "Dockerfile" in file_names
         assert "README.md" in file_names
 
-    def test_scaffold_python_handler(self, code_mgr: CodeRepoManager):
-        ms = _make_microservice(language="python")
-        manifest = code_mgr.scaffold(ms)
-
-        content = code_mgr.get_file_content("order-processor", "handler.py")
-        assert content is not None
-        assert "order-processor" in content
-        assert "handle_event" in content
-        assert "__metadata__" in content
-
-    def test_scaffold_go_handler(self, code_mgr: CodeRepoManager):
-        ms = _make_microservice(name="go-svc", language="go", framework="Gin")
-        manifest = code_mgr.scaffold(ms)
+    @pytest.mark.parametrize("language,framework,expected_files,handler_fragments", LANG_CASES)
+    def test_scaffold_languages(self, shared_code_mgr: CodeRepoManager, language,
+                                framework, expected_files, handler_fragments):
+        name = f"{language}-svc"
+        ms = _make_microservice(name=name, language=language, framework=framework)
+        manifest = shared_code_mgr.scaffold(ms)
 
-        file_names = [f["name"] for f in manifest["files"]]
-        assert "main.go" in file_names
-        assert "go.mod" in file_names
+        file_names = {f["name"] for f in manifest["files"]}
+        assert expected_files <= file_names
 
-        content = code_mgr.get_file_content("go-svc", "main.go")
+        handler_file = LANGUAGE_TEMPLATES[language]["handler_file"]
+        content = shared_code_mgr.get_file_content(name, handler_file)
         assert content is not None
-        assert "gin" in content.lower() or "Gin" in content
-
-    def test_scaffold_java_handler(self, code_mgr: CodeRepoManager):
-        ms = _make_microservice(name="java-svc", language="java", framework="Spring Boot")
-        manifest = code_mgr.scaffold(ms)
-
-        file_names = [f["name"] for f in manifest["files"]]
-        assert "Handler.java" in file_names
-        assert "pom.xml" in file_names
-
-    def test_scaffold_typescript_handler(self, code_mgr: CodeRepoManager):
-        ms = _make_microservice(name="ts-svc", language="typescript", framework="NestJS")
-        manifest = code_mgr.scaffold(ms)
-
-        file_names = [f["name"] for f in manifest["files"]]
-        assert "handler.ts" in file_names
-        assert "package.json" in file_names
-
-    def test_scaffold_rust_handler(self, code_mgr: CodeRepoManager):
-        ms = _make_microservice(name="rust-svc", language="rust", framework="Actix")
-        manifest = code_mgr.scaffold(ms)
-
-        file_names = [f["name"] for f in manifest["files"]]
-        assert "main.rs" in file_names
-        assert "Cargo.toml" in file_names
-
-    def test_scaffold_kotlin_handler(self, code_mgr: CodeRepoManager):
-        ms = _make_microservice(name="kt-svc", language="kotlin", framework="Ktor")
-        manifest = code_mgr.scaffold(ms)
-
-        file_names = [f["name"] for f in manifest["files"]]
-        assert "Application.kt" in file_names
-        assert "build.gradle.kts" in file_names
+        assert name in content
+        for fragment in handler_fragments:
+            assert fragment in content
 
     def test_scaffold_correct_language_templates(self):
         """Verify all 6 language templates are registered."""
@@ -145,17 +137,13 @@ class TestScaffold:
         m2 = code_mgr.scaffold(ms)
         assert len(m1["files"]) == len(m2["files"])
 
-    def test_dockerfile_has_correct_base(self, code_mgr: CodeRepoManager):
-        ms = _make_microservice(language="python")
-        code_mgr.scaffold(ms)
-        content = code_mgr.get_file_content("order-processor", "Dockerfile")
+    def test_dockerfile_has_correct_base(self, scaffolded_code_mgr: CodeRepoManager):
+        content = scaffolded_code_mgr.get_file_content("order-processor", "Dockerfile")
         assert content is not None
         assert "python:" in content.lower()
 
-    def test_readme_contains_ms_name(self, code_mgr: CodeRepoManager):
-        ms = _make_microservice()
-        code_mgr.scaffold(ms)
-        content = code_mgr.get_file_content("order-processor", "README.md")
+    def test_readme_contains_ms_name(self, scaffolded_code_mgr: CodeRepoManager):
+        content = scaffolded_code_mgr.get_file_content("order-processor", "README.md")
         assert content is not None
         assert "order-processor" in content
 
@@ -183,10 +171,8 @@ class TestBatchScaffold:
 class TestManifestAndQuery:
     """Tests for manifest retrieval and querying."""
 
-    def test_manifest_returns_files(self, code_mgr: CodeRepoManager):
-        ms = _make_microservice()
-        code_mgr.scaffold(ms)
-        manifest = code_mgr.get_manifest("order-processor")
+    def test_manifest_returns_files(self, scaffolded_code_mgr: CodeRepoManager):
+        manifest = scaffolded_code_mgr.get_manifest("order-processor")
         assert manifest is not None
         assert len(manifest["files"]) == 4
 
@@ -194,10 +180,8 @@ class TestManifestAndQuery:
         manifest = code_mgr.get_manifest("nonexistent-service")
         assert manifest is None
 
-    def test_get_file_content(self, code_mgr: CodeRepoManager):
-        ms = _make_microservice()
-        code_mgr.scaffold(ms)
-        content = code_mgr.get_file_content("order-processor", "handler.py")
+    def test_get_file_content(self, scaffolded_code_mgr: CodeRepoManager):
+        content = scaffolded_code_mgr.get_file_content("order-processor", "handler.py")
         assert content is not None
         assert len(content) > 0
 
@@ -233,6 +217,46 @@ class TestCleanup:
         assert len(code_mgr.list_repos()) == 0
 
 
+class TestDiskBackend:
+    """Tests for the on-disk repo backend."""
+
+    def test_disk_round_trip(self, disk_code_mgr: CodeRepoManager, tmp_repo_path):
+        manifest = disk_code_mgr.scaffold(_make_microservice())
+        assert os.path.isfile(os.path.join(tmp_repo_path, "order-processor", "handler.py"))
+        assert disk_code_mgr.get_manifest("order-processor")["files"][0]["name"] == "Dockerfile"
+        assert "order-processor" in disk_code_mgr.get_file_content("order-processor", "README.md")
+        assert disk_code_mgr.list_repos() == ["order-processor"]
+        assert disk_code_mgr.clear_all() == 1
+        assert not os.path.exists(manifest["repo_path"])
+
+    def test_disk_blocks_path_traversal(self, disk_code_mgr: CodeRepoManager):
+        disk_code_mgr.scaffold(_make_microservice())
+        assert disk_code_mgr.get_file_content("order-processor", "../../etc/passwd") is None
+
+    def test_delete_repo_propagates_errors(self, disk_code_mgr: CodeRepoManager, monkeypatch):
+        disk_code_mgr.scaffold(_make_microservice())
+
+        def fail(path, ignore_errors=False):
+            if not ignore_errors:
+                raise PermissionError(path)
+
+        monkeypatch.setattr("worldmaker.codegen.manager.shutil.rmtree", fail)
+        with pytest.raises(PermissionError):
+            disk_code_mgr.delete_repo("order-processor")
+        assert disk_code_mgr.clear_all() == 1
+
+    def test_unknown_backend_rejected(self, tmp_repo_path):
+        with pytest.raises(ValueError, match="mem"):
+            CodeRepoManager(base_path=tmp_repo_path, backend="mem")
+
+    def test_backend_instance_used_as_given(self, tmp_repo_path):
+        backend = MemoryBackend(Path(tmp_repo_path))
+        mgr = CodeRepoManager(base_path=tmp_repo_path, backend=backend)
+        mgr.scaffold(_make_microservice())
+        assert backend.list_repos() == ["order-processor"]
+        assert not os.path.exists(os.path.join(tmp_repo_path, "order-processor"))
+
+
 class TestTemplateGenerators:
     """Tests for template generation functions directly."""
 
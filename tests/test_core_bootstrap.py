@@ -11,11 +11,13 @@ Verifies:
 """
 from __future__ import annotations
 
+import pickle
+from typing import Any
+
 import pytest
 
 from worldmaker.db.memory import InMemoryStore
-from worldmaker.generators.core_platforms import bootstrap_core, CORE_PLATFORMS
-from worldmaker.generators.ecosystem import generate_ecosystem
+from worldmaker.generators.core_platforms import bootstrap_core, CORE_CAPABILITY_COUNT, CORE_PLATFORM_NAMES
 
 
 EXPECTED_PLATFORM_NAMES = [
@@ -30,68 +32,128 @@ EXPECTED_PLATFORM_NAMES = [
     "Security Management",
 ]
 
-EXPECTED_CAPABILITY_COUNT = sum(len(p["capabilities"]) for p in CORE_PLATFORMS)  # 45
+EXPECTED_CAPABILITY_COUNT = CORE_CAPABILITY_COUNT  # 45
 # Each capability gets one service
 EXPECTED_SERVICE_COUNT = EXPECTED_CAPABILITY_COUNT
 
 
+@pytest.fixture(scope="session")
+def _core_store_blob() -> bytes:
+    """Bootstrap the core platforms once per session and snapshot the store."""
+    template = InMemoryStore()
+    bootstrap_core(template)
+    return template.snapshot()
+
+
+@pytest.fixture(scope="session")
+def readonly_core_store(_core_store_blob: bytes) -> InMemoryStore:
+    """One bootstrapped store shared by tests that only read from it."""
+    shared = InMemoryStore()
+    shared.restore(_core_store_blob)
+    return shared
+
+
+@pytest.fixture(scope="module")
+def core_snapshot(readonly_core_store: InMemoryStore) -> dict[str, Any]:
+    """Core-layer platforms, capabilities and services, plus their id sets, fetched once."""
+    snapshot: dict[str, Any] = {
+        "platforms": readonly_core_store.get_by_attr("platform", "layer", "core"),
+        "capabilities": readonly_core_store.get_by_attr("capability", "layer", "core"),
+        "services": readonly_core_store.get_by_attr("service", "layer", "core"),
+    }
+    # Ids are uuid4s minted at bootstrap, so these can't be module constants
+    snapshot["platform_ids"] = frozenset(p["id"] for p in snapshot["platforms"])
+    snapshot["capability_ids"] = frozenset(c["id"] for c in snapshot["capabilities"])
+    return snapshot
+
+
 @pytest.fixture
-def core_store() -> InMemoryStore:
+def core_store(store: InMemoryStore, _core_store_blob: bytes) -> InMemoryStore:
     """Provide a store with core platforms bootstrapped."""
-    store = InMemoryStore()
-    bootstrap_core(store)
+    store.restore(_core_store_blob)
     return store
 
 
+@pytest.fixture(scope="session")
+def _layered_store_blob(_core_store_blob: bytes, _small_ecosystem_blob: bytes) -> bytes:
+    """Load the small ecosystem on top of the core layer once and snapshot it."""
+    template = InMemoryStore()
+    template.restore(_core_store_blob)
+    template.load_ecosystem(pickle.loads(_small_ecosystem_blob))
+    return template.snapshot()
+
+
+@pytest.fixture
+def layered_store(store: InMemoryStore, _layered_store_blob: bytes) -> InMemoryStore:
+    """Provide a store holding both the core and a generated layer."""
+    store.restore(_layered_store_blob)
+    return store
+
+
+@pytest.fixture(scope="module")
+def cleared_generated(_layered_store_blob: bytes) -> tuple[InMemoryStore, dict[str, int], int]:
+    """Clear the generated layer once for tests that only inspect the result.
+
+    Returns the cleared store, clear_layer's counts, and the dependency
+    count from before the clear.
+    """
+    cleared = InMemoryStore()
+    cleared.restore(_layered_store_blob)
+    original_dep_count = len(cleared._dependencies)
+    counts = cleared.clear_layer("generated")
+    return cleared, counts, original_dep_count
+
+
 class TestBootstrapCreation:
     """Tests for initial core bootstrap."""
 
-    def test_bootstrap_creates_nine_platforms(self, core_store: InMemoryStore):
-        platforms = core_store.get_all("platform", limit=100, filters={"layer": "core"})
+    def test_bootstrap_creates_nine_platforms(self, core_snapshot):
+        platforms = core_snapshot["platforms"]
         assert len(platforms) == 9
 
-    def test_bootstrap_correct_names(self, core_store: InMemoryStore):
-        platforms = core_store.get_all("platform", limit=100, filters={"layer": "core"})
+    def test_bootstrap_correct_names(self, core_snapshot):
+        platforms = core_snapshot["platforms"]
         names = sorted(p["name"] for p in platforms)
         assert names == sorted(EXPECTED_PLATFORM_NAMES)
+        assert CORE_PLATFORM_NAMES == set(EXPECTED_PLATFORM_NAMES)
 
-    def test_bootstrap_creates_capabilities(self, core_store: InMemoryStore):
-        capabilities = core_store.get_all("capability", limit=200, filters={"layer": "core"})
+    def test_bootstrap_creates_capabilities(self, core_snapshot):
+        capabilities = core_snapshot["capabilities"]
         assert len(capabilities) == EXPECTED_CAPABILITY_COUNT
 
-    def test_bootstrap_creates_services(self, core_store: InMemoryStore):
-        services = core_store.get_all("service", limit=200, filters={"layer": "core"})
+    def test_bootstrap_creates_services(self, core_snapshot):
+        services = core_snapshot["services"]
         assert len(services) == EXPECTED_SERVICE_COUNT
 
-    def test_all_core_platforms_active(self, core_store: InMemoryStore):
-        platforms = core_store.get_all("platform", limit=100, filters={"layer": "core"})
+    def test_all_core_platforms_active(self, core_snapshot):
+        platforms = core_snapshot["platforms"]
         for p in platforms:
             assert p["status"] == "active"
 
-    def test_all_core_capabilities_have_layer(self, core_store: InMemoryStore):
-        capabilities = core_store.get_all("capability", limit=200, filters={"layer": "core"})
+    def test_all_core_capabilities_have_layer(self, core_snapshot):
+        capabilities = core_snapshot["capabilities"]
         for cap in capabilities:
             assert cap["layer"] == "core"
 
-    def test_all_core_services_have_layer(self, core_store: InMemoryStore):
-        services = core_store.get_all("service", limit=200, filters={"layer": "core"})
+    def test_all_core_services_have_layer(self, core_snapshot):
+        services = core_snapshot["services"]
         for svc in services:
             assert svc["layer"] == "core"
 
-    def test_capability_has_platform_reference(self, core_store: InMemoryStore):
-        capabilities = core_store.get_all("capability", limit=200, filters={"layer": "core"})
-        platform_ids = {p["id"] for p in core_store.get_all("platform", limit=100)}
+    def test_capability_has_platform_reference(self, core_snapshot):
+        capabilities = core_snapshot["capabilities"]
+        platform_ids = core_snapshot["platform_ids"]
         for cap in capabilities:
             assert cap["platform_id"] in platform_ids
 
-    def test_service_has_capability_reference(self, core_store: InMemoryStore):
-        services = core_store.get_all("service", limit=200, filters={"layer": "core"})
-        cap_ids = {c["id"] for c in core_store.get_all("capability", limit=200)}
+    def test_service_has_capability_reference(self, core_snapshot):
+        services = core_snapshot["services"]
+        cap_ids = core_snapshot["capability_ids"]
         for svc in services:
             assert svc["capability_id"] in cap_ids
 
-    def test_platform_metadata_has_counts(self, core_store: InMemoryStore):
-        platforms = core_store.get_all("platform", limit=100, filters={"layer": "core"})
+    def test_platform_metadata_has_counts(self, core_snapshot):
+        platforms = core_snapshot["platforms"]
         for p in platforms:
             metadata = p.get("metadata", {})
             assert "capability_count" in metadata
@@ -116,56 +178,31 @@ class TestBootstrapIdempotency:
         assert result.get("skipped") is True
 
         # Still exactly 9 platforms
-        platforms = core_store.get_all("platform", limit=100, filters={"layer": "core"})
-        assert len(platforms) == 9
+        assert core_store.count("platform", {"layer": "core"}) == 9
 
     def test_idempotency_no_duplicate_capabilities(self, core_store: InMemoryStore):
         bootstrap_core(core_store)
-        capabilities = core_store.get_all("capability", limit=500, filters={"layer": "core"})
-        assert len(capabilities) == EXPECTED_CAPABILITY_COUNT
+        assert core_store.count("capability", {"layer": "core"}) == EXPECTED_CAPABILITY_COUNT
 
     def test_idempotency_no_duplicate_services(self, core_store: InMemoryStore):
         bootstrap_core(core_store)
-        services = core_store.get_all("service", limit=500, filters={"layer": "core"})
-        assert len(services) == EXPECTED_SERVICE_COUNT
+        assert core_store.count("service", {"layer": "core"}) == EXPECTED_SERVICE_COUNT
 
 
 class TestLayerOperations:
     """Tests for layer-aware store operations."""
 
-    def test_clear_generated_preserves_core(self, core_store: InMemoryStore):
-        # Add some generated entities
-        eco = generate_ecosystem(seed=42, size="small")
-        core_store.load_ecosystem(eco)
-
-        # Verify we have both layers
-        all_platforms = core_store.get_all("platform", limit=500)
-        assert len(all_platforms) > 9
-
-        # Clear generated
-        core_store.clear_layer("generated")
-
-        # Core platforms still exist
-        core_platforms = core_store.get_all("platform", limit=100, filters={"layer": "core"})
-        assert len(core_platforms) == 9
-
-    def test_clear_generated_removes_generated(self, core_store: InMemoryStore):
-        eco = generate_ecosystem(seed=42, size="small")
-        core_store.load_ecosystem(eco)
-
-        core_store.clear_layer("generated")
-
-        gen_platforms = core_store.get_all("platform", limit=100, filters={"layer": "generated"})
-        assert len(gen_platforms) == 0
+    def test_clear_generated_preserves_core(self, cleared_generated):
+        store, _, _ = cleared_generated
+        assert store.count("platform", {"layer": "core"}) == 9
 
-        gen_services = core_store.get_all("service", limit=500, filters={"layer": "generated"})
-        assert len(gen_services) == 0
+    def test_clear_generated_removes_generated(self, cleared_generated):
+        store, _, _ = cleared_generated
+        assert store.count("platform", {"layer": "generated"}) == 0
+        assert store.count("service", {"layer": "generated"}) == 0
 
-    def test_clear_generated_returns_counts(self, core_store: InMemoryStore):
-        eco = generate_ecosystem(seed=42, size="small")
-        core_store.load_ecosystem(eco)
-
-        counts = core_store.clear_layer("generated")
+    def test_clear_generated_returns_counts(self, cleared_generated):
+        _, counts, _ = cleared_generated
         # Should have deleted some platforms
         assert counts.get("platform", 0) > 0
         # Traces/spans should be cleared too
@@ -179,15 +216,11 @@ class TestLayerOperations:
 
         store.clear_layer("core")
 
-        platforms = store.get_all("platform", limit=100, filters={"layer": "core"})
-        assert len(platforms) == 0
+        assert store.count("platform", {"layer": "core"}) == 0
 
-    def test_generate_on_top_of_core(self, core_store: InMemoryStore):
+    def test_generate_on_top_of_core(self, layered_store: InMemoryStore):
         """Generator should augment core, not replace it."""
-        eco = generate_ecosystem(seed=42, size="small")
-        core_store.load_ecosystem(eco)
-
-        all_platforms = core_store.get_all("platform", limit=500)
+        all_platforms = layered_store.get_all("platform", limit=500)
         core_platforms = [p for p in all_platforms if p.get("layer") == "core"]
         gen_platforms = [p for p in all_platforms if p.get("layer") == "generated"]
 
@@ -199,56 +232,29 @@ class TestLayerOperations:
 class TestGeneratedEntitiesHaveLayer:
     """All generated entities must have layer='generated'."""
 
-    def test_generated_platforms_have_layer(self):
-        eco = generate_ecosystem(seed=42, size="small")
-        for p in eco.get("platforms", []):
-            assert p.get("layer") == "generated", f"Platform {p.get('name')} missing layer"
-
-    def test_generated_services_have_layer(self):
-        eco = generate_ecosystem(seed=42, size="small")
-        for s in eco.get("services", []):
-            assert s.get("layer") == "generated", f"Service {s.get('name')} missing layer"
-
-    def test_generated_capabilities_have_layer(self):
-        eco = generate_ecosystem(seed=42, size="small")
-        for c in eco.get("capabilities", []):
-            assert c.get("layer") == "generated"
-
-    def test_generated_products_have_layer(self):
-        eco = generate_ecosystem(seed=42, size="small")
-        for p in eco.get("products", []):
-            assert p.get("layer") == "generated"
-
-    def test_generated_flows_have_layer(self):
-        eco = generate_ecosystem(seed=42, size="small")
-        for f in eco.get("flows", []):
-            assert f.get("layer") == "generated"
+    @pytest.mark.parametrize("key", ["platforms", "services", "capabilities", "products", "flows"])
+    def test_generated_entities_have_layer(self, small_ecosystem, key):
+        for entity in small_ecosystem.get(key, []):
+            assert entity.get("layer") == "generated", f"{key}: {entity.get('name')} missing layer"
 
 
 class TestDependencyIndexRebuild:
     """Tests for _rebuild_dep_indexes after clear_layer."""
 
-    def test_dependency_indexes_valid_after_clear(self, core_store: InMemoryStore):
-        eco = generate_ecosystem(seed=42, size="small")
-        core_store.load_ecosystem(eco)
-
-        core_store.clear_layer("generated")
+    def test_dependency_indexes_valid_after_clear(self, cleared_generated):
+        store, _, _ = cleared_generated
 
         # Dep indexes should be consistent
-        for idx_list in core_store._dep_index_source.values():
+        for idx_list in store._dep_index_source.values():
             for idx in idx_list:
-                assert idx < len(core_store._dependencies)
+                assert idx < len(store._dependencies)
 
-        for idx_list in core_store._dep_index_target.values():
+        for idx_list in store._dep_index_target.values():
             for idx in idx_list:
-                assert idx < len(core_store._dependencies)
-
-    def test_dep_count_consistent_after_clear(self, core_store: InMemoryStore):
-        eco = generate_ecosystem(seed=42, size="small")
-        core_store.load_ecosystem(eco)
+                assert idx < len(store._dependencies)
 
-        original_dep_count = len(core_store._dependencies)
-        counts = core_store.clear_layer("generated")
-        remaining = len(core_store._dependencies)
+    def test_dep_count_consistent_after_clear(self, cleared_generated):
+        store, counts, original_dep_count = cleared_generated
+        remaining = len(store._dependencies)
 
         assert remaining == original_dep_count - counts.get("dependencies", 0)
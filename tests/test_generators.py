@@ -1,9 +1,24 @@
 """Tests for the ecosystem generator."""
 from __future__ import annotations
 
+import json
+import pickle
+import random
+from collections import defaultdict
 import pytest
-from worldmaker.generators.ecosystem import generate_ecosystem, EcosystemGenerator
+from uuid import UUID
+
+from worldmaker.generators.ecosystem import generate_ecosystem, EcosystemGenerator, _AdjacencyBitset
 from worldmaker.generators.base import GeneratorConfig
+from worldmaker.generators.names import NameGenerator
+
+
+@pytest.fixture(scope="session")
+def small_ids(_small_ecosystem_blob: bytes) -> dict[str, frozenset[str]]:
+    """Entity ids of the small seed-42 ecosystem per entity list, built once."""
+    eco = pickle.loads(_small_ecosystem_blob)
+    return {key: frozenset(e["id"] for e in eco[key])
+            for key in ("services", "platforms")}
 
 
 class TestEcosystemGeneration:
@@ -18,9 +33,9 @@ class TestEcosystemGeneration:
         assert s["flows"] > 0
         assert s["dependencies"] > 0
 
-    def test_medium_ecosystem(self, medium_ecosystem):
+    def test_medium_ecosystem(self, medium_ecosystem, small_ecosystem):
         s = medium_ecosystem["summary"]
-        assert s["services"] > small_count(s)
+        assert s["services"] > small_ecosystem["summary"]["services"]
         assert s["platforms"] >= 5
 
     def test_reproducibility(self):
@@ -33,14 +48,31 @@ class TestEcosystemGeneration:
         names2 = sorted(s["name"] for s in eco2["services"])
         assert names1 == names2
 
-    def test_different_seeds_produce_different_data(self):
-        eco1 = generate_ecosystem(seed=42, size="small")
-        eco2 = generate_ecosystem(seed=99, size="small")
+    def test_factory_copies_are_independent(self, ecosystem_factory):
+        eco1 = ecosystem_factory(42, "small")
+        eco1["services"][0]["name"] = "mutated"
+        eco1["services"][0]["microservice_ids"].append("mutated")
+        eco2 = ecosystem_factory(42, "small")
+        assert eco2["services"][0]["name"] != "mutated"
+        assert "mutated" not in eco2["services"][0]["microservice_ids"]
+
+    def test_different_seeds_produce_different_data(self, ecosystem_factory):
+        eco1 = ecosystem_factory(42, "small")
+        eco2 = ecosystem_factory(99, "small")
         names1 = set(s["name"] for s in eco1["services"])
         names2 = set(s["name"] for s in eco2["services"])
         # Should have some differences
         assert names1 != names2
 
+    def test_to_json_round_trips(self, tmp_path):
+        gen = EcosystemGenerator(seed=42, size="small")
+        eco = gen.generate()
+        out = tmp_path / "eco.json"
+        data = json.loads(gen.to_json(str(out)))
+        assert data["summary"] == eco["summary"]
+        assert json.loads(out.read_text()) == data
+        assert len(data["services"]) == len(eco["services"])
+
     def test_all_entity_types_present(self, small_ecosystem):
         expected_keys = [
             "products", "platforms", "capabilities", "services",
@@ -61,36 +93,49 @@ class TestEcosystemGeneration:
             assert "capability_id" in svc
             assert "platform_id" in svc
 
-    def test_flow_steps_reference_valid_services(self, small_ecosystem):
-        service_ids = {s["id"] for s in small_ecosystem["services"]}
+    def test_entity_ids_are_canonical_uuids(self, small_ecosystem):
+        for key in ("products", "services", "microservices", "dependencies"):
+            for entity in small_ecosystem[key]:
+                assert str(UUID(entity["id"])) == entity["id"]
+
+    def test_flow_steps_reference_valid_services(self, small_ecosystem, small_ids):
+        service_ids = small_ids["services"]
         for step in small_ecosystem["flow_steps"]:
             assert step["from_service_id"] in service_ids
             assert step["to_service_id"] in service_ids
 
-    def test_dependencies_reference_valid_services(self, small_ecosystem):
-        service_ids = {s["id"] for s in small_ecosystem["services"]}
+    def test_dependencies_reference_valid_services(self, small_ecosystem, small_ids):
+        service_ids = small_ids["services"]
         for dep in small_ecosystem["dependencies"]:
             assert dep["source_id"] in service_ids
             assert dep["target_id"] in service_ids
 
-    def test_microservices_reference_valid_services(self, small_ecosystem):
-        service_ids = {s["id"] for s in small_ecosystem["services"]}
+    def test_microservices_reference_valid_services(self, small_ecosystem, small_ids):
+        service_ids = small_ids["services"]
         for ms in small_ecosystem["microservices"]:
             assert ms["service_id"] in service_ids
 
-    def test_capabilities_reference_valid_platforms(self, small_ecosystem):
-        platform_ids = {p["id"] for p in small_ecosystem["platforms"]}
+    def test_capabilities_reference_valid_platforms(self, small_ecosystem, small_ids):
+        platform_ids = small_ids["platforms"]
         for cap in small_ecosystem["capabilities"]:
             assert cap["platform_id"] in platform_ids
 
+    def test_adjacency_bitset_matches_pair_set(self):
+        edges = {(0, 1), (1, 0), (2, 2), (4, 3), (3, 4)}
+        bits = _AdjacencyBitset(5)
+        for edge in edges:
+            bits.add(edge)
+        for i in range(5):
+            for j in range(5):
+                assert ((i, j) in bits) == ((i, j) in edges)
+
     def test_flow_steps_ordered(self, small_ecosystem):
-        flow_ids = {f["id"] for f in small_ecosystem["flows"]}
-        for flow_id in flow_ids:
-            steps = [s for s in small_ecosystem["flow_steps"]
-                     if s["flow_id"] == flow_id]
-            if len(steps) > 1:
-                step_numbers = [s["step_number"] for s in steps]
-                assert step_numbers == sorted(step_numbers)
+        # Group steps by flow in one pass rather than rescanning per flow
+        steps_by_flow: dict[str, list[int]] = defaultdict(list)
+        for step in small_ecosystem["flow_steps"]:
+            steps_by_flow[step["flow_id"]].append(step["step_number"])
+        for step_numbers in steps_by_flow.values():
+            assert step_numbers == sorted(step_numbers)
 
 
 class TestGeneratorConfig:
@@ -116,14 +161,33 @@ class TestGeneratorConfig:
         assert lo > 0
         assert hi >= lo
 
-    def test_large_produces_more(self):
-        small = generate_ecosystem(seed=1, size="small")
-        large = generate_ecosystem(seed=1, size="large")
+    def test_large_produces_more(self, ecosystem_factory):
+        small = ecosystem_factory(1, "small")
+        large = ecosystem_factory(1, "large")
         assert large["summary"]["services"] > small["summary"]["services"]
         assert large["summary"]["platforms"] > small["summary"]["platforms"]
 
 
-def small_count(summary: dict) -> int:
-    """Helper to get a reference small count for comparison."""
-    small = generate_ecosystem(seed=42, size="small")
-    return small["summary"]["services"]
+class TestNameGenerator:
+    """Test realistic name generation."""
+
+    def test_microservice_name_kebab_cases_service(self):
+        names = NameGenerator(random.Random(0))
+        assert names.microservice_name("RiskScoringService").startswith("risk-scoring-")
+        # Names outside SERVICE_PATTERNS take the uncached path
+        assert names.microservice_name("LedgerSyncService").startswith("ledger-sync-")
+        # Only a trailing "Service" is dropped
+        assert names.microservice_name("ServiceMeshService").startswith("service-mesh-")
+
+    def test_service_names_batch_is_unique(self):
+        names = NameGenerator(random.Random(0))
+        batch = names.service_names("payment", 3)
+        assert len(set(batch)) == 3
+        # Oversized batches fall back to suffixing
+        assert len(set(names.service_names("payment", 12))) == 12
+
+    def test_unique_suffixes_skip_taken_names(self):
+        names = NameGenerator(random.Random(0))
+        assert names._unique("Ledger") == "Ledger"
+        assert names._unique("Ledger-3") == "Ledger-3"
+        assert [names._unique("Ledger") for _ in range(3)] == ["Ledger-2", "Ledger-4", "Ledger-5"]
@@ -1,6 +1,8 @@
 """Tests for the InMemoryStore — CRUD, dependencies, audit, search."""
 from __future__ import annotations
 
+import pickle
+
 import pytest
 from worldmaker.db.memory import InMemoryStore
 
@@ -15,6 +17,14 @@ class TestCRUD:
         assert "created_at" in entity
         assert "updated_at" in entity
 
+    def test_create_many_matches_create(self, store: InMemoryStore):
+        created = store.create_many("service", [{"name": "a"}, {"id": "svc-b", "name": "b"}])
+        assert [e["name"] for e in created] == ["a", "b"]
+        assert created[1]["id"] == "svc-b"
+        assert store.count("service") == 2
+        assert store.get("service", created[0]["id"])["created_at"] == created[0]["created_at"]
+        assert len(store.get_audit_log(entity_id="svc-b")) == 1
+
     def test_get_entity(self, store: InMemoryStore):
         created = store.create("service", {"name": "auth-service"})
         fetched = store.get("service", created["id"])
@@ -27,6 +37,8 @@ class TestCRUD:
         fetched["tags"].append("b")
         original = store.get("service", created["id"])
         assert "b" not in original["tags"]
+        stored, = store.iter_entities("service")
+        assert stored["tags"] == ["a"]
 
     def test_get_nonexistent_returns_none(self, store: InMemoryStore):
         assert store.get("service", "nonexistent") is None
@@ -79,6 +91,77 @@ class TestCRUD:
         store.create("product", {"name": "p2", "status": "planned"})
         assert store.count("product", {"status": "active"}) == 1
 
+    def test_get_by_attr_tracks_writes(self, store: InMemoryStore):
+        a = store.create("service", {"name": "svc-a", "status": "active"})
+        store.create("service", {"name": "svc-b", "status": "degraded"})
+        assert [e["name"] for e in store.get_by_attr("service", "status", "active")] == ["svc-a"]
+
+        # Index is live after the first lookup
+        c = store.create("service", {"name": "svc-c", "status": "active"})
+        store.update("service", a["id"], {"status": "degraded"})
+        assert [e["id"] for e in store.get_by_attr("service", "status", "active")] == [c["id"]]
+        store.delete("service", c["id"])
+        assert store.get_by_attr("service", "status", "active") == []
+        assert store.count("service", {"status": "degraded"}) == 2
+
+    def test_filtered_get_all_follows_index(self, store: InMemoryStore):
+        a = store.create("service", {"name": "svc-a", "layer": "core", "status": "active"})
+        store.create("service", {"name": "svc-b", "layer": "core", "status": "degraded"})
+        assert len(store.get_all("service", filters={"layer": "core"})) == 2
+
+        store.update("service", a["id"], {"status": "degraded", "layer": "core"})
+        degraded = store.get_all("service", filters={"layer": "core", "status": "degraded"})
+        assert [e["name"] for e in degraded] == ["svc-a", "svc-b"]
+        store.update("service", a["id"], {"layer": "generated"})
+        assert [e["name"] for e in store.get_all("service", filters={"layer": "core"})] == ["svc-b"]
+
+    def test_filtered_get_all_keeps_insertion_order(self, store: InMemoryStore):
+        for i in range(3):
+            store.create("service", {"id": str(i), "status": "active"})
+        assert store.count("service", {"status": "active"}) == 3
+        store.update("service", "0", {"status": "x"})
+        store.update("service", "0", {"status": "active"})
+        active = store.get_all("service", filters={"status": "active"})
+        assert [e["id"] for e in active] == [e["id"] for e in store.get_all("service")]
+        assert [e["id"] for e in store.get_all("service", limit=1, offset=1,
+                                                 filters={"status": "active"})] == ["1"]
+
+        store.delete("service", "1")
+        store.create("service", {"id": "1", "status": "active"})
+        clone = InMemoryStore()
+        clone.restore(store.snapshot())
+        for s in (store, clone):
+            ids = [e["id"] for e in s.get_all("service", filters={"status": "active"})]
+            assert ids == [e["id"] for e in s.get_all("service")] == ["0", "2", "1"]
+
+    @pytest.mark.parametrize("bulk", [False, True])
+    def test_overwrite_reindexes(self, store: InMemoryStore, bulk: bool):
+        store.create("service", {"id": "x", "layer": "a"})
+        assert store.count("service", {"layer": "a"}) == 1
+        if bulk:
+            store.create_many("service", [{"id": "x", "layer": "b"}])
+        else:
+            store.create("service", {"id": "x", "layer": "b"})
+        assert store.get_all("service", filters={"layer": "a"}) == []
+        assert store.count("service", {"layer": "a"}) == 0
+        assert [e["id"] for e in store.get_by_attr("service", "layer", "b")] == ["x"]
+
+    def test_create_returns_copy(self, store: InMemoryStore):
+        created = store.create("service", {"name": "svc", "status": "active"})
+        assert store.count("service", {"status": "active"}) == 1
+        created["status"] = "degraded"
+        store.create_many("service", [{"id": "bulk", "status": "active"}])[0]["status"] = "degraded"
+        assert store.count("service", {"status": "active"}) == 2
+        assert store.get("service", created["id"])["status"] == "active"
+
+    def test_iter_entities_yields_read_only_views(self, store: InMemoryStore):
+        store.create("service", {"name": "svc-1"})
+        store.create("service", {"name": "svc-2"})
+        assert [e["name"] for e in store.iter_entities("service")] == ["svc-1", "svc-2"]
+        assert list(store.iter_entities("product")) == []
+        with pytest.raises(TypeError):
+            next(store.iter_entities("service"))["name"] = "renamed"  # type: ignore[index]
+
     def test_search(self, store: InMemoryStore):
         store.create("service", {"name": "payment-gateway"})
         store.create("service", {"name": "auth-service"})
@@ -172,6 +255,27 @@ class TestAuditLog:
         assert len(log) == 2
         assert log[1]["action"] == "deleted"
 
+    def test_audit_disabled_suspends_logging(self, store: InMemoryStore):
+        with store.audit_disabled():
+            entity = store.create("service", {"name": "quiet"})
+            store.update("service", entity["id"], {"name": "still-quiet"})
+            store.create_many("service", [{"name": "bulk"}])
+        assert store.get_audit_log() == []
+        store.delete("service", entity["id"])
+        assert len(store.get_audit_log(entity_id=entity["id"])) == 1
+
+    def test_entity_lookup_follows_appends_and_clears(self, store: InMemoryStore):
+        a = store.create("service", {"name": "a", "layer": "generated"})
+        assert len(store.get_audit_log(entity_id=a["id"])) == 1
+        store.update("service", a["id"], {"name": "a2"})
+        store.create("service", {"name": "b"})
+        assert [e["action"] for e in store.get_audit_log(entity_id=a["id"])] == ["created", "modified"]
+
+        store.clear_layer("generated")
+        assert store.get_audit_log(entity_id=a["id"]) == []
+        c = store.create("service", {"name": "c"})
+        assert len(store.get_audit_log(entity_id=c["id"])) == 1
+
     def test_filter_by_entity_type(self, store: InMemoryStore):
         store.create("service", {"name": "svc"})
         store.create("product", {"name": "prod"})
@@ -196,6 +300,26 @@ class TestBulkLoad:
         assert overview["total_entities"] > 0
         assert overview["total_dependencies"] > 0
 
+    def test_snapshot_restore_round_trips(self, seeded_store: InMemoryStore):
+        blob = seeded_store.snapshot()
+        svc = seeded_store.get_all("service", limit=1)[0]
+        seeded_store.delete("service", svc["id"])
+
+        restored = InMemoryStore()
+        restored.restore(blob)
+        assert restored.get("service", svc["id"]) == svc
+        assert restored.get_dependencies_of(svc["id"]) == seeded_store.get_dependencies_of(svc["id"])
+        assert restored.get_overview()["audit_log_entries"] == seeded_store.get_overview()["audit_log_entries"] - 1
+
+    def test_store_pickles_without_attr_index(self, seeded_store: InMemoryStore):
+        seeded_store.get_by_attr("service", "status", "active")
+        with seeded_store.audit_disabled():
+            clone = pickle.loads(pickle.dumps(seeded_store))
+        assert clone._attr_index == {}
+        assert clone._audit_enabled
+        assert clone.get_overview() == seeded_store.get_overview()
+        assert clone.get_by_attr("service", "status", "active") == seeded_store.get_by_attr("service", "status", "active")
+
 
 class TestTraceStorage:
     """Test trace and span storage."""
@@ -8,10 +8,14 @@ These tests validate the migration without requiring a live database by:
 """
 from __future__ import annotations
 
+import functools
 import importlib
 import os
+import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
 
 import pytest
 
@@ -24,10 +28,15 @@ from worldmaker.db.postgres.tables import Base
 MIGRATION_DIR = os.path.join(os.path.dirname(__file__), "..", "alembic", "versions")
 MIGRATION_FILE = os.path.join(MIGRATION_DIR, "20260208_0001_initial_schema.py")
 PROJECT_ROOT = os.path.join(os.path.dirname(__file__), "..")
+ENV_PY_FILE = os.path.join(PROJECT_ROOT, "alembic", "env.py")
 
 
+@functools.lru_cache(maxsize=1)
 def _load_migration():
-    """Load the migration module without triggering Alembic's op context."""
+    """Load the migration module without triggering Alembic's op context.
+
+    Cached: every structural test reads the same unchanging file.
+    """
     spec = importlib.util.spec_from_file_location(
         "migration_0001",
         MIGRATION_FILE,
@@ -40,12 +49,73 @@ def _load_migration():
         return f.read()
 
 
-def _run_alembic(args: list[str]) -> str:
-    """Run alembic CLI and return stdout."""
+_CREATE_TABLE_RE = re.compile(r'op\.create_table\(\s*"(\w+)"')
+_DROP_TABLE_RE = re.compile(r'op\.drop_table\("(\w+)"\)')
+_QUOTED_NAME_RE = re.compile(r'"(\w+)"')
+# Column lists hold no parens, so [^)]* spans exactly one create_index call
+_CREATE_INDEX_RE = re.compile(r'op\.create_index\(\s*"(\w+)"[^)]*\)')
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env_py() -> str:
+    """Read alembic/env.py once for the env.py content checks."""
+    with open(ENV_PY_FILE) as f:
+        return f.read()
+
+
+class _MigrationSections(NamedTuple):
+    upgrade: str
+    downgrade: str
+    creation_pos: dict[str, int]
+    drop_pos: dict[str, int]
+    quoted_names: frozenset[str]
+    index_unique: dict[str, bool]
+
+
+def _first_positions(names: list[str]) -> dict[str, int]:
+    """Map each name to the index of its first occurrence, like list.index."""
+    positions: dict[str, int] = {}
+    for i, name in enumerate(names):
+        positions.setdefault(name, i)
+    return positions
+
+
+@functools.lru_cache(maxsize=1)
+def _migration_sections() -> _MigrationSections:
+    """Split the migration once into its upgrade and downgrade sections.
+
+    Also extracts table creation/drop positions, every quoted identifier
+    and each index's unique flag, so per-table checks are lookups, not
+    substring scans.
+    """
+    content = _load_migration()
+    head, sep, tail = content.partition("def downgrade()")
+    upgrade_section = head[head.index("def upgrade()"):]
+    downgrade_section = sep + tail
+    return _MigrationSections(
+        upgrade=upgrade_section,
+        downgrade=downgrade_section,
+        creation_pos=_first_positions(_CREATE_TABLE_RE.findall(upgrade_section)),
+        drop_pos=_first_positions(_DROP_TABLE_RE.findall(downgrade_section)),
+        quoted_names=frozenset(_QUOTED_NAME_RE.findall(content)),
+        index_unique={
+            m.group(1): "unique=True" in m.group(0)
+            for m in _CREATE_INDEX_RE.finditer(upgrade_section)
+        },
+    )
+
+
+@functools.cache
+def _run_alembic(*args: str) -> str:
+    """Run alembic CLI and return stdout.
+
+    Cached per argument tuple, so tests sharing an offline command share
+    one subprocess (each one re-imports SQLAlchemy and Alembic).
+    """
     env = os.environ.copy()
     env["PATH"] = f"/sessions/stoic-adoring-maxwell/.local/bin:{env.get('PATH', '')}"
     result = subprocess.run(
-        ["alembic"] + args,
+        ["alembic", *args],
         cwd=PROJECT_ROOT,
         capture_output=True,
         text=True,
@@ -76,22 +146,19 @@ class TestMigrationFileStructure:
 
     def test_creates_all_tables(self):
         """Verify every SQLAlchemy table has a corresponding create_table call."""
-        content = _load_migration()
+        quoted_names = _migration_sections().quoted_names
         model_tables = set(Base.metadata.tables.keys())
         for table_name in model_tables:
-            assert f'"{table_name}"' in content, (
+            assert table_name in quoted_names, (
                 f"Table '{table_name}' from SQLAlchemy models not found in migration"
             )
 
     def test_drops_all_tables_in_downgrade(self):
         """Verify downgrade drops every table."""
-        content = _load_migration()
-        # Extract the downgrade section
-        downgrade_start = content.index("def downgrade()")
-        downgrade_section = content[downgrade_start:]
+        dropped = _migration_sections().drop_pos
         model_tables = set(Base.metadata.tables.keys())
         for table_name in model_tables:
-            assert f'drop_table("{table_name}")' in downgrade_section, (
+            assert table_name in dropped, (
                 f"Table '{table_name}' not dropped in downgrade()"
             )
 
@@ -108,12 +175,8 @@ class TestMetadataConsistency:
 
     def test_table_count_matches(self):
         """Migration should create exactly as many tables as models define."""
-        content = _load_migration()
         # Count op.create_table calls in upgrade
-        upgrade_start = content.index("def upgrade()")
-        downgrade_start = content.index("def downgrade()")
-        upgrade_section = content[upgrade_start:downgrade_start]
-        create_count = upgrade_section.count("op.create_table(")
+        create_count = _migration_sections().upgrade.count("op.create_table(")
         model_count = len(Base.metadata.tables)
         assert create_count == model_count, (
             f"Migration creates {create_count} tables but models define {model_count}"
@@ -121,32 +184,25 @@ class TestMetadataConsistency:
 
     def test_all_foreign_keys_present(self):
         """Verify all FK relationships from models appear in migration."""
-        content = _load_migration()
+        quoted_names = _migration_sections().quoted_names
         for table in Base.metadata.sorted_tables:
             for fk in table.foreign_keys:
                 target_table = fk.column.table.name
-                assert f'"{target_table}"' in content, (
+                assert target_table in quoted_names, (
                     f"FK target '{target_table}' from {table.name} not in migration"
                 )
 
     def test_fk_creation_order(self):
         """Tables with FKs must be created after their referenced tables."""
-        content = _load_migration()
-        upgrade_start = content.index("def upgrade()")
-        downgrade_start = content.index("def downgrade()")
-        upgrade_section = content[upgrade_start:downgrade_start]
-
-        # Build creation order from migration
-        import re
-        creation_order = re.findall(r'op\.create_table\(\s*"(\w+)"', upgrade_section)
+        creation_pos = _migration_sections().creation_pos
 
         for table in Base.metadata.sorted_tables:
             for fk in table.foreign_keys:
                 target_name = fk.column.table.name
                 source_name = table.name
-                if source_name in creation_order and target_name in creation_order:
-                    target_idx = creation_order.index(target_name)
-                    source_idx = creation_order.index(source_name)
+                if source_name in creation_pos and target_name in creation_pos:
+                    target_idx = creation_pos[target_name]
+                    source_idx = creation_pos[source_name]
                     assert target_idx < source_idx, (
                         f"Table '{source_name}' (idx {source_idx}) created before "
                         f"its FK target '{target_name}' (idx {target_idx})"
@@ -154,20 +210,15 @@ class TestMetadataConsistency:
 
     def test_fk_drop_order(self):
         """Tables with FKs must be dropped before their referenced tables."""
-        content = _load_migration()
-        downgrade_start = content.index("def downgrade()")
-        downgrade_section = content[downgrade_start:]
-
-        import re
-        drop_order = re.findall(r'op\.drop_table\("(\w+)"\)', downgrade_section)
+        drop_pos = _migration_sections().drop_pos
 
         for table in Base.metadata.sorted_tables:
             for fk in table.foreign_keys:
                 target_name = fk.column.table.name
                 source_name = table.name
-                if source_name in drop_order and target_name in drop_order:
-                    target_idx = drop_order.index(target_name)
-                    source_idx = drop_order.index(source_name)
+                if source_name in drop_pos and target_name in drop_pos:
+                    target_idx = drop_pos[target_name]
+                    source_idx = drop_pos[source_name]
                     assert source_idx < target_idx, (
                         f"Table '{target_name}' (idx {target_idx}) dropped before "
                         f"'{source_name}' (idx {source_idx}) which has FK to it"
@@ -175,7 +226,7 @@ class TestMetadataConsistency:
 
     def test_unique_constraints_present(self):
         """Verify unique indexes from models are in the migration."""
-        content = _load_migration()
+        index_unique = _migration_sections().index_unique
         # Known unique constraints from the models
         unique_indexes = [
             "ix_business_process_features_unique",
@@ -183,41 +234,59 @@ class TestMetadataConsistency:
             "ix_version_tracking_entity_version",
         ]
         for idx_name in unique_indexes:
-            assert idx_name in content, (
+            assert idx_name in index_unique, (
                 f"Unique index '{idx_name}' not found in migration"
             )
-            # Also verify unique=True is set
-            # Find the index creation and check for unique=True
-            idx_pos = content.index(idx_name)
-            # Look within 200 chars after the index name for unique=True
-            snippet = content[idx_pos:idx_pos + 200]
-            assert "unique=True" in snippet, (
+            assert index_unique[idx_name], (
                 f"Unique index '{idx_name}' missing unique=True"
             )
 
 
+_ALEMBIC_COMMANDS = (
+    ("history",),
+    ("heads",),
+    ("current",),
+    ("upgrade", "head", "--sql"),
+    ("downgrade", "0001:base", "--sql"),
+)
+
+
+@pytest.fixture(scope="module")
+def _prewarmed_alembic():
+    """Launch every distinct alembic command concurrently up front.
+
+    Each run is dominated by interpreter and SQLAlchemy import time, so
+    overlapping the subprocesses (one per spare core) fills _run_alembic's
+    cache in roughly the time of the slowest one.
+    """
+    workers = min(len(_ALEMBIC_COMMANDS), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(lambda args: _run_alembic(*args), _ALEMBIC_COMMANDS))
+
+
+@pytest.mark.usefixtures("_prewarmed_alembic")
 class TestAlembicCLI:
     """Test Alembic CLI operations (requires alembic on PATH)."""
 
     def test_history_shows_migration(self):
-        output = _run_alembic(["history"])
+        output = _run_alembic("history")
         assert "0001" in output
         assert "Initial schema" in output
 
     def test_heads_shows_single_head(self):
-        output = _run_alembic(["heads"])
+        output = _run_alembic("heads")
         assert "0001" in output
         assert "(head)" in output
 
     def test_current_shows_nothing(self):
         """With no DB, current should indicate no version."""
-        output = _run_alembic(["current"])
+        output = _run_alembic("current")
         # Offline or error — just verify it doesn't crash badly
         assert "0001" not in output or "current" in output.lower() or "error" in output.lower()
 
     def test_upgrade_sql_generates_valid_ddl(self):
         """Offline upgrade should produce valid PostgreSQL DDL."""
-        output = _run_alembic(["upgrade", "head", "--sql"])
+        output = _run_alembic("upgrade", "head", "--sql")
         assert "CREATE TABLE products" in output
         assert "CREATE TABLE services" in output
         assert "CREATE TABLE flow_steps" in output
@@ -228,7 +297,7 @@ class TestAlembicCLI:
 
     def test_downgrade_sql_generates_valid_ddl(self):
         """Offline downgrade should produce valid DROP statements."""
-        output = _run_alembic(["downgrade", "0001:base", "--sql"])
+        output = _run_alembic("downgrade", "0001:base", "--sql")
         assert "DROP TABLE flow_steps" in output
         assert "DROP TABLE products" in output
         assert "DELETE FROM alembic_version" in output
@@ -236,14 +305,14 @@ class TestAlembicCLI:
 
     def test_upgrade_sql_table_count(self):
         """Verify the correct number of tables in generated SQL."""
-        output = _run_alembic(["upgrade", "head", "--sql"])
+        output = _run_alembic("upgrade", "head", "--sql")
         # Count CREATE TABLE statements (includes alembic_version)
         create_count = output.count("CREATE TABLE")
         assert create_count == 26, f"Expected 26 CREATE TABLE (25 + alembic_version), got {create_count}"
 
     def test_downgrade_sql_table_count(self):
         """Verify the correct number of drops in downgrade SQL."""
-        output = _run_alembic(["downgrade", "0001:base", "--sql"])
+        output = _run_alembic("downgrade", "0001:base", "--sql")
         drop_count = output.count("DROP TABLE")
         # 25 entity tables + alembic_version
         assert drop_count == 26, f"Expected 26 DROP TABLE, got {drop_count}"
@@ -253,26 +322,19 @@ class TestEnvPy:
     """Test the Alembic env.py configuration."""
 
     def test_env_py_exists(self):
-        env_path = os.path.join(PROJECT_ROOT, "alembic", "env.py")
-        assert os.path.isfile(env_path)
+        assert os.path.isfile(ENV_PY_FILE)
 
     def test_env_py_imports_base(self):
-        env_path = os.path.join(PROJECT_ROOT, "alembic", "env.py")
-        with open(env_path) as f:
-            content = f.read()
+        content = _load_env_py()
         assert "from worldmaker.db.postgres.tables import Base" in content
 
     def test_env_py_has_async_support(self):
-        env_path = os.path.join(PROJECT_ROOT, "alembic", "env.py")
-        with open(env_path) as f:
-            content = f.read()
+        content = _load_env_py()
         assert "run_async_migrations" in content
         assert "async" in content
 
     def test_env_py_has_url_resolution(self):
-        env_path = os.path.join(PROJECT_ROOT, "alembic", "env.py")
-        with open(env_path) as f:
-            content = f.read()
+        content = _load_env_py()
         assert "WM_POSTGRES_URL" in content
         assert "get_database_url" in content
 
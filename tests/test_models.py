@@ -0,0 +1,161 @@
+"""Tests for the pydantic domain models."""
+from __future__ import annotations
+
+import importlib
+import pkgutil
+from datetime import datetime
+from typing import Literal, get_args, get_origin
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+import worldmaker.models
+from worldmaker.models import base
+from worldmaker.models.base import BaseEntity, EntityReference, Severity
+from worldmaker.models.dependency import ImpactChain
+from worldmaker.models.lifecycle import ChangeEvent
+
+
+def _entity_models() -> list[type[BaseEntity]]:
+    for mod in pkgutil.iter_modules(worldmaker.models.__path__):
+        importlib.import_module(f"worldmaker.models.{mod.name}")
+    models, pending = [], list(BaseEntity.__subclasses__())
+    while pending:
+        cls = pending.pop()
+        models.append(cls)
+        pending.extend(cls.__subclasses__())
+    return sorted(models, key=lambda cls: cls.__name__)
+
+
+def _literal_defaults() -> list:
+    return [
+        pytest.param(get_args(field.annotation), field.default, id=f"{model.__name__}.{name}")
+        for model in _entity_models()
+        for name, field in model.model_fields.items()
+        if get_origin(field.annotation) is Literal and not field.is_required()
+    ]
+
+
+class TestLiteralFields:
+    """Enum-valued fields are typed as Literal aliases over the enum values."""
+
+    @pytest.mark.parametrize(("allowed", "default"), _literal_defaults())
+    def test_defaults_are_allowed_plain_strings(self, allowed, default):
+        assert type(default) is str
+        assert default in allowed
+
+    def test_enum_members_accepted_as_values(self):
+        event = _change(severity=Severity.HIGH)
+        assert event.severity == "high"
+        assert type(event.severity) is str
+        assert type(_change().severity) is str
+
+    def test_unknown_value_rejected(self):
+        with pytest.raises(ValidationError):
+            _change(severity="catastrophic")
+
+    def test_alias_drift_detected(self, monkeypatch):
+        monkeypatch.setattr(base, "SeverityLit", Literal["critical", "high"])
+        with pytest.raises(TypeError, match="Severity"):
+            base._check_literals()
+
+
+class TestBaseEntity:
+    """Shared fields every domain entity inherits."""
+
+    def test_defaulted_timestamps_match(self):
+        event = _change()
+        assert event.created_at == event.updated_at
+
+    def test_explicit_timestamp_kept(self):
+        created = datetime(2024, 1, 1)
+        event = _change(created_at=created)
+        assert event.created_at == created
+        assert event.updated_at > created
+
+
+def _change(**kwargs):
+    return ChangeEvent(title="rollout", change_type="hotfix", author="ops", **kwargs)
+
+
+class TestChangeEvent:
+    """Affected entities are stored as columns but dumped as a reference list."""
+
+    def test_reference_list_splits_into_columns(self):
+        a, b = uuid4(), uuid4()
+        event = _change(affected_entities=[
+            {"id": str(a), "entity_type": "service", "name": "auth"},
+            EntityReference(id=b, entity_type="platform"),
+        ])
+        assert event.affected_entity_ids == [a, b]
+        assert event.affected_entity_types == ["service", "platform"]
+        assert event.affected_entity_names == ["auth", None]
+
+    def test_affected_entities_property_round_trips(self):
+        refs = [EntityReference(id=uuid4(), entity_type="service", name="auth"),
+                EntityReference(id=uuid4(), entity_type="flow")]
+        event = _change(affected_entities=[r.model_dump() for r in refs])
+        assert event.affected_entities == refs
+        assert ChangeEvent.model_validate(event.model_dump()).affected_entities == refs
+        assert ChangeEvent.model_validate_json(event.model_dump_json()).affected_entities == refs
+
+    def test_dump_keeps_reference_list_shape(self):
+        ref_id = uuid4()
+        dumped = _change(affected_entities=[
+            {"id": str(ref_id), "entity_type": "service", "name": "auth"},
+        ]).model_dump()
+        assert dumped["affected_entities"] == [
+            {"id": ref_id, "entity_type": "service", "name": "auth"},
+        ]
+        assert not any(key.startswith("affected_entity_") for key in dumped)
+
+    def test_references_and_columns_not_combined(self):
+        with pytest.raises(ValidationError, match="cannot be combined"):
+            _change(affected_entities=[{"id": str(uuid4()), "entity_type": "service"}],
+                    affected_entity_ids=[uuid4()])
+
+    def test_columns_without_names(self):
+        event = _change(affected_entity_ids=[uuid4()], affected_entity_types=["service"])
+        assert event.affected_entity_names == [None]
+        assert event.affected_entities[0].name is None
+
+    @pytest.mark.parametrize("columns", [
+        {"affected_entity_ids": [uuid4()], "affected_entity_types": []},
+        {"affected_entity_ids": [uuid4()], "affected_entity_types": ["service"],
+         "affected_entity_names": ["a", "b"]},
+    ])
+    def test_mismatched_columns_rejected(self, columns):
+        with pytest.raises(ValidationError):
+            _change(**columns)
+
+    @pytest.mark.parametrize("refs", [
+        [{"id": str(uuid4()), "name": "no-type"}],
+        ["not-a-mapping"],
+        {"id": str(uuid4()), "entity_type": "service"},
+    ])
+    def test_malformed_references_raise_validation_error(self, refs):
+        with pytest.raises(ValidationError):
+            _change(affected_entities=refs)
+
+
+class TestImpactChain:
+    """Reference dicts go through the shared EntityReference cache."""
+
+    def test_repeated_references_are_shared(self):
+        ref = {"id": str(uuid4()), "entity_type": "service", "name": "auth"}
+        a = ImpactChain(root_cause_id=uuid4(), root_cause_type="service", affected_entities=[ref])
+        b = ImpactChain(root_cause_id=uuid4(), root_cause_type="service", affected_entities=[dict(ref)])
+        assert a.affected_entities[0] is b.affected_entities[0]
+
+    @pytest.mark.parametrize(("bad", "field"), [
+        ({"id": str(uuid4()), "entity_type": "service", "name": ["auth"]}, "name"),
+        ({"id": str(uuid4()), "entity_type": "unknown"}, "entity_type"),
+        ({"id": "not-a-uuid", "entity_type": "service"}, "id"),
+    ])
+    def test_malformed_reference_reported_per_item(self, bad, field):
+        good = {"id": str(uuid4()), "entity_type": "service"}
+        with pytest.raises(ValidationError) as exc:
+            ImpactChain(root_cause_id=uuid4(), root_cause_type="service",
+                        affected_entities=[good, bad])
+        assert [e["loc"] for e in exc.value.errors()] == [("affected_entities", 1, field)]
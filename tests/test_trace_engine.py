@@ -1,41 +1,49 @@
 """Tests for the OpenTelemetry trace engine."""
 from __future__ import annotations
 
+from collections import Counter
+
 import pytest
 from worldmaker.db.memory import InMemoryStore
 from worldmaker.engine.trace import TraceEngine, Span, SpanEvent
 
 
+@pytest.fixture(scope="module")
+def baseline_trace(_seeded_store_blob: bytes) -> tuple[InMemoryStore, dict, dict]:
+    """Execute the first seeded flow once; return (store, flow, trace).
+
+    For tests that only inspect the resulting trace and stored spans.
+    """
+    store = InMemoryStore()
+    store.restore(_seeded_store_blob)
+    engine = TraceEngine(store=store, rng_seed=42)
+    flows = store.get_all("flow", limit=1)
+    assert len(flows) > 0, "Expected at least one flow in seeded store"
+    flow = flows[0]
+    return store, flow, engine.execute_flow_by_id(flow["id"])
+
+
 class TestTraceExecution:
     """Test flow execution and trace generation."""
 
-    def test_execute_flow_generates_trace(self, seeded_store: InMemoryStore):
-        engine = TraceEngine(store=seeded_store, rng_seed=42)
-        flows = seeded_store.get_all("flow", limit=1)
-        assert len(flows) > 0, "Expected at least one flow in seeded store"
-
-        flow = flows[0]
-        trace = engine.execute_flow_by_id(flow["id"])
+    def test_execute_flow_generates_trace(self, baseline_trace):
+        _, _, trace = baseline_trace
 
         assert "trace_id" in trace
         assert len(trace["trace_id"]) == 32  # 128-bit hex
         assert trace["span_count"] > 0
         assert trace["status"] in ("STATUS_CODE_OK", "STATUS_CODE_ERROR")
 
-    def test_trace_has_root_span(self, seeded_store: InMemoryStore):
-        engine = TraceEngine(store=seeded_store, rng_seed=42)
-        flows = seeded_store.get_all("flow", limit=1)
-        trace = engine.execute_flow_by_id(flows[0]["id"])
+    def test_trace_has_root_span(self, baseline_trace):
+        _, _, trace = baseline_trace
 
         spans = trace["spans"]
         root_spans = [s for s in spans if s.get("parentSpanId") == ""]
         assert len(root_spans) == 1
         assert root_spans[0]["operationName"].startswith("FLOW ")
 
-    def test_spans_have_required_fields(self, seeded_store: InMemoryStore):
-        engine = TraceEngine(store=seeded_store, rng_seed=42)
-        flows = seeded_store.get_all("flow", limit=1)
-        trace = engine.execute_flow_by_id(flows[0]["id"])
+    def test_spans_have_required_fields(self, baseline_trace):
+        _, _, trace = baseline_trace
 
         for span in trace["spans"]:
             assert "traceId" in span
@@ -47,18 +55,22 @@ class TestTraceExecution:
             assert "attributes" in span
             assert "resource" in span
 
-    def test_client_server_span_pairs(self, seeded_store: InMemoryStore):
-        engine = TraceEngine(store=seeded_store, rng_seed=42)
-        flows = seeded_store.get_all("flow", limit=1)
-        trace = engine.execute_flow_by_id(flows[0]["id"])
+    def test_client_server_span_pairs(self, baseline_trace):
+        _, _, trace = baseline_trace
 
-        spans = trace["spans"]
-        non_root = [s for s in spans if s.get("parentSpanId") != ""]
-        client_spans = [s for s in non_root if s["kind"] == "SPAN_KIND_CLIENT"]
-        server_spans = [s for s in non_root if s["kind"] == "SPAN_KIND_SERVER"]
+        # Tally non-root span kinds in one pass
+        kinds = Counter(s["kind"] for s in trace["spans"] if s.get("parentSpanId") != "")
 
         # Every client span should have a corresponding server span
-        assert len(client_spans) == len(server_spans)
+        assert kinds["SPAN_KIND_CLIENT"] == kinds["SPAN_KIND_SERVER"]
+
+        # ...and it is that server span's parent: pair them via a span-id index
+        kind_by_id = {s["spanId"]: s["kind"] for s in trace["spans"]}
+        server_parents = Counter(s["parentSpanId"] for s in trace["spans"]
+                                 if s["kind"] == "SPAN_KIND_SERVER")
+        for parent_id, n in server_parents.items():
+            assert kind_by_id.get(parent_id) == "SPAN_KIND_CLIENT"
+            assert n == 1
 
     def test_inject_failure(self, seeded_store: InMemoryStore):
         engine = TraceEngine(store=seeded_store, rng_seed=42)
@@ -76,9 +88,7 @@ class TestTraceExecution:
 
         # Find a flow with multiple steps
         for flow in flows:
-            steps = seeded_store.get_all("flow_step", limit=100,
-                                          filters={"flow_id": flow["id"]})
-            if len(steps) >= 2:
+            if seeded_store.count("flow_step", {"flow_id": flow["id"]}) >= 2:
                 trace = engine.execute_flow_by_id(
                     flow["id"], inject_failure=True, failure_step=1
                 )
@@ -86,21 +96,17 @@ class TestTraceExecution:
                 assert trace["error"]["step"] == 1
                 break
 
-    def test_trace_stored_in_memory(self, seeded_store: InMemoryStore):
-        engine = TraceEngine(store=seeded_store, rng_seed=42)
-        flows = seeded_store.get_all("flow", limit=1)
-        trace = engine.execute_flow_by_id(flows[0]["id"])
+    def test_trace_stored_in_memory(self, baseline_trace):
+        store, flow, trace = baseline_trace
 
-        stored_traces = seeded_store.get_traces(flow_id=flows[0]["id"])
+        stored_traces = store.get_traces(flow_id=flow["id"])
         assert len(stored_traces) >= 1
         assert stored_traces[0]["trace_id"] == trace["trace_id"]
 
-    def test_spans_stored_in_memory(self, seeded_store: InMemoryStore):
-        engine = TraceEngine(store=seeded_store, rng_seed=42)
-        flows = seeded_store.get_all("flow", limit=1)
-        trace = engine.execute_flow_by_id(flows[0]["id"])
+    def test_spans_stored_in_memory(self, baseline_trace):
+        store, _, trace = baseline_trace
 
-        stored_spans = seeded_store.get_spans(trace_id=trace["trace_id"])
+        stored_spans = store.get_spans(trace_id=trace["trace_id"])
         assert len(stored_spans) == trace["span_count"]
 
     def test_execute_all_flows(self, seeded_store: InMemoryStore):
@@ -122,17 +128,13 @@ class TestTraceExecution:
 class TestJaegerFormat:
     """Test Jaeger-compatible span output."""
 
-    def test_jaeger_format_present(self, seeded_store: InMemoryStore):
-        engine = TraceEngine(store=seeded_store, rng_seed=42)
-        flows = seeded_store.get_all("flow", limit=1)
-        trace = engine.execute_flow_by_id(flows[0]["id"])
+    def test_jaeger_format_present(self, baseline_trace):
+        _, _, trace = baseline_trace
         assert "spans_jaeger" in trace
         assert len(trace["spans_jaeger"]) == len(trace["spans"])
 
-    def test_jaeger_span_fields(self, seeded_store: InMemoryStore):
-        engine = TraceEngine(store=seeded_store, rng_seed=42)
-        flows = seeded_store.get_all("flow", limit=1)
-        trace = engine.execute_flow_by_id(flows[0]["id"])
+    def test_jaeger_span_fields(self, baseline_trace):
+        _, _, trace = baseline_trace
 
         for span in trace["spans_jaeger"]:
             assert "traceID" in span